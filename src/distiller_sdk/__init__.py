@@ -1,11 +1,24 @@
 import os
 
-from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("distiller-sdk")
-except PackageNotFoundError:
-    __version__ = "dev"
+def __getattr__(name):
+    """
+    Resolve ``__version__`` on first access.
+
+    importlib.metadata is by far the slowest import in the package, so it is only
+    loaded when the version is actually asked for rather than by every hardware
+    module import.
+    """
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            resolved = version("distiller-sdk")
+        except PackageNotFoundError:
+            resolved = "dev"
+        globals()["__version__"] = resolved
+        return resolved
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_model_path(module_name):
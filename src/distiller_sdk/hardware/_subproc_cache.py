@@ -0,0 +1,82 @@
+"""
+Shared cache for the output of hardware probe commands.
+
+Device listings such as ``arecord -l`` or ``rpicam-still --list-cameras`` are run
+by every Audio/Camera/Piper instance that checks its configuration, but their
+output only changes on hotplug. Routing them through cached_run() makes the number
+of probe subprocesses per process O(1) instead of O(instances).
+"""
+
+import subprocess
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+# argv -> (monotonic time of the run, (returncode, stdout, stderr))
+_results: Dict[Tuple[str, ...], Tuple[float, Tuple[int, str, str]]] = {}
+_lock = threading.Lock()
+
+cache_hits = 0
+cache_misses = 0
+
+
+def cached_run(argv: Sequence[str], ttl: float = 5.0) -> Tuple[int, str, str]:
+    """
+    Run a probe command, reusing its output if it ran less than ``ttl`` seconds ago.
+
+    Args:
+        argv: Command and arguments
+        ttl: Maximum age in seconds of a reusable result
+
+    Returns:
+        Tuple[int, str, str]: (returncode, stdout, stderr)
+
+    Raises:
+        OSError: If the command can't be started (e.g. FileNotFoundError); such
+            failures are not cached
+    """
+    global cache_hits, cache_misses
+
+    key = tuple(argv)
+    with _lock:
+        entry = _results.get(key)
+        if entry is not None and time.monotonic() - entry[0] <= ttl:
+            cache_hits += 1
+            return entry[1]
+
+    result = subprocess.run(list(key), capture_output=True, text=True, check=False)
+    value = (result.returncode, result.stdout, result.stderr)
+
+    with _lock:
+        cache_misses += 1
+        _results[key] = (time.monotonic(), value)
+    return value
+
+
+def invalidate(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Drop cached results so the next cached_run() runs the command again.
+
+    Args:
+        argv: Command to forget, or None to forget every cached command
+    """
+    with _lock:
+        if argv is None:
+            _results.clear()
+        else:
+            _results.pop(tuple(argv), None)
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    Get cache hit/miss counters.
+
+    Returns:
+        Dict[str, int]: ``cache_hits``, ``cache_misses`` and ``cached_commands``
+    """
+    with _lock:
+        return {
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
+            "cached_commands": len(_results),
+        }
@@ -4,11 +4,62 @@ Audio module for CM5 SDK.
 Provides functionality for audio recording, playback, and microphone/speaker volume control.
 """
 
+import atexit
+import errno
+import fcntl
+import functools
 import os
-import time
+import queue
+import shutil
+import signal
+import stat
 import subprocess
 import threading
-from typing import Optional, Union, Callable, BinaryIO
+import time
+import wave
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, wait
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple, Union, Callable, BinaryIO
+
+from distiller_sdk.hardware import _subproc_cache
+
+# Native ALSA bindings are optional; without them playback falls back to aplay
+try:
+    import alsaaudio  # type: ignore
+
+    ALSAAUDIO_AVAILABLE = True
+except ImportError:
+    alsaaudio = None
+    ALSAAUDIO_AVAILABLE = False
+
+# Bytes per sample for the ALSA formats we can feed to a native PCM handle
+_FORMAT_SAMPLE_BYTES = {
+    "S8": 1,
+    "U8": 1,
+    "S16_LE": 2,
+    "S24_3LE": 3,
+    "S24_LE": 4,
+    "S32_LE": 4,
+    "FLOAT_LE": 4,
+}
+
+# ALSA format matching a WAV file's sample width
+_WAV_SAMPLE_FORMATS = {1: "U8", 2: "S16_LE", 3: "S24_3LE", 4: "S32_LE"}
+
+# sysfs controls exposed by the PamirAI soundcard codec driver
+_CODEC_SYSFS_DIR = "/sys/devices/platform/axi/1000120000.pcie/1f00074000.i2c/i2c-1/1-0018"
+_MIC_GAIN_PATH = f"{_CODEC_SYSFS_DIR}/input_gain"
+_SPEAKER_VOLUME_PATH = f"{_CODEC_SYSFS_DIR}/volume_level"
+
+# Encoded sysfs payloads for the usual 0-100 level range
+_LEVEL_BYTES = tuple(str(level).encode() for level in range(101))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_alsa_utils() -> Tuple[Optional[str], Optional[str]]:
+    """Locate arecord and aplay on PATH, returning (arecord, aplay) paths or None."""
+    return shutil.which("arecord"), shutil.which("aplay")
 
 
 class AudioError(Exception):
@@ -17,6 +68,194 @@ class AudioError(Exception):
     pass
 
 
+class _SPSCRing:
+    """
+    Bounded single-producer/single-consumer queue of preallocated audio buffers.
+
+    Buffers are allocated once and filled in place, so steady-state streaming
+    allocates nothing. Filled buffers are queued by index; a short lock covers the
+    queue and the free list, and an Event wakes the consumer when data arrives. One
+    buffer beyond ``capacity`` backs the one the consumer is reading, so the
+    producer never writes into it.
+
+    When the consumer falls ``capacity`` buffers behind, ``policy`` decides what is
+    lost. ``drop_oldest`` discards the oldest queued buffer to make room for each
+    incoming one, so the consumer resumes with the most recent audio.
+    ``drop_newest`` discards incoming buffers until there is room again. ``block``
+    makes the producer wait for the consumer instead.
+    """
+
+    POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(self, capacity: int, slot_size: int, policy: str = "drop_oldest"):
+        self._views = [memoryview(bytearray(slot_size)) for _ in range(capacity + 1)]
+        self._lengths = [0] * (capacity + 1)
+        self._capacity = capacity
+        self._slot_size = slot_size
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._queued: Deque[int] = deque()  # Filled buffers, oldest first
+        self._free = list(range(capacity + 1))
+        self._reserved: List[int] = []  # Handed to the producer by reserve()
+        self._reading: Optional[int] = None  # Handed to the consumer by peek()
+        self.dropped = 0  # Incoming buffers lost to a full ring
+        self.skipped = 0  # Queued buffers discarded for newer ones (drop_oldest)
+        self.closed = False
+        self.cancelled = False
+        self._ready = threading.Event()
+        self._space = threading.Event()
+
+    @property
+    def lost(self) -> int:
+        """Total buffers that never reached the consumer."""
+        return self.dropped + self.skipped
+
+    def reserve(self, limit: int = 1) -> List[memoryview]:
+        """
+        Get up to ``limit`` free slots, in order, for the producer to fill.
+
+        Only blocks under the ``block`` policy.
+
+        Args:
+            limit: Maximum number of slots to hand out
+
+        Returns:
+            List[memoryview]: Writable slots, or an empty list if the incoming
+            buffer has to be dropped (it is then counted as dropped)
+        """
+        while (
+            self._policy == "block" and len(self._queued) >= self._capacity and not self.cancelled
+        ):
+            self._space.wait()
+            self._space.clear()
+
+        with self._lock:
+            room = self._capacity - len(self._queued)
+            if room <= 0:
+                if self._policy != "drop_oldest":
+                    self.dropped += 1
+                    return []
+                # Free exactly one slot by discarding the oldest queued buffer
+                self._free.append(self._queued.popleft())
+                self.skipped += 1
+                room = 1
+            self._reserved = [self._free.pop() for _ in range(min(limit, room))]
+        return [self._views[index] for index in self._reserved]
+
+    def commit(self, length: int) -> None:
+        """
+        Publish ``length`` bytes written across the slots returned by reserve().
+
+        Slots are filled front to back, so every slot but the last one is full.
+        """
+        with self._lock:
+            for index in self._reserved:
+                if length <= 0:
+                    self._free.append(index)
+                    continue
+                self._lengths[index] = min(length, self._slot_size)
+                length -= self._lengths[index]
+                self._queued.append(index)
+            self._reserved = []
+        self._ready.set()
+
+    def peek(self) -> Optional[memoryview]:
+        """
+        Get the oldest queued buffer, blocking until one is available.
+
+        Returns:
+            Optional[memoryview]: The filled part of the slot, or None once the ring
+            is closed and drained
+        """
+        while True:
+            with self._lock:
+                if self._queued:
+                    index = self._reading = self._queued.popleft()
+                    return self._views[index][: self._lengths[index]]
+                if self.closed:
+                    return None
+            self._ready.wait()
+            self._ready.clear()
+
+    def release(self) -> None:
+        """Hand the slot returned by peek() back to the producer."""
+        with self._lock:
+            if self._reading is not None:
+                self._free.append(self._reading)
+                self._reading = None
+        self._space.set()
+
+    def close(self) -> None:
+        """Mark the producer as finished and wake the consumer."""
+        self.closed = True
+        self._ready.set()
+
+    def cancel(self) -> None:
+        """Mark the consumer as gone so a blocked producer stops waiting."""
+        self.cancelled = True
+        self._space.set()
+
+
+class _JobWorker:
+    """
+    Long-lived thread that runs submitted jobs one at a time, in order.
+
+    The thread is started on the first submit and then parked on a SimpleQueue
+    between jobs, so each play/record costs a queue put instead of a thread spawn.
+    Workers created with ``drain_at_exit`` hold interpreter shutdown until their
+    current job finishes, like a non-daemon thread would.
+    """
+
+    _draining: "weakref.WeakSet[_JobWorker]" = weakref.WeakSet()
+
+    def __init__(self, name: str, drain_at_exit: bool = False):
+        self._name = name
+        self._jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._idle = threading.Event()
+        self._idle.set()
+        if drain_at_exit:
+            _JobWorker._draining.add(self)
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue a job, starting the worker thread if it isn't running yet."""
+        self._idle.clear()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+        self._jobs.put(job)
+
+    def _run(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            try:
+                job()
+            except Exception as e:
+                print(f"Warning: {self._name} job failed: {str(e)}")
+            # Drop the finished closure now rather than when the next job arrives,
+            # so an idle worker doesn't keep its Audio instance alive
+            job = None
+            if self._jobs.empty():
+                self._idle.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has finished."""
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        """Let the worker thread exit once the queued jobs are done."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread = None
+
+    @staticmethod
+    def _drain_all() -> None:
+        for worker in list(_JobWorker._draining):
+            worker.wait_idle()
+
+
+atexit.register(_JobWorker._drain_all)
+
+
 class Audio:
     """
     Audio class for interacting with the CM5 audio system.
@@ -36,16 +275,56 @@ class Audio:
     """
 
     # Default hardware paths for PamirAI soundcard controls
-    MIC_GAIN_PATH = (
-        "/sys/devices/platform/axi/1000120000.pcie/1f00074000.i2c/i2c-1/1-0018/input_gain"
-    )
-    SPEAKER_VOLUME_PATH = (
-        "/sys/devices/platform/axi/1000120000.pcie/1f00074000.i2c/i2c-1/1-0018/volume_level"
-    )
+    MIC_GAIN_PATH = _MIC_GAIN_PATH
+    SPEAKER_VOLUME_PATH = _SPEAKER_VOLUME_PATH
+
+    # sysfs control descriptors shared by all instances and the static methods,
+    # opened on first use and kept for the life of the process (None when the file
+    # can't be opened directly and sudo must be used instead)
+    _sysfs_fds: Dict[Tuple[str, int], Optional[int]] = {}
+
+    # Seconds an ``arecord -l`` result is reused by check_system_config()
+    DEVICE_PROBE_TTL = 60.0
+
+    # Last level written to / read from each sysfs control in this process, used to
+    # skip redundant writes (e.g. a UI slider re-sending the same value)
+    _sysfs_levels: Dict[str, int] = {}
+
+    # Number of buffers queued between the stream_record reader and the callback
+    STREAM_RING_SLOTS = 32
+
+    # ALSA periods per capture buffer and callback buffers per pipe in stream_record
+    STREAM_PERIODS = 4
+
+    # Default SCHED_FIFO priority for the stream_record reader and the native
+    # stream_play writer (0 keeps the normal scheduler)
+    STREAM_RT_PRIORITY = 50
+
+    # CPUs to pin real-time audio threads to, e.g. {3} for a core kept free with
+    # isolcpus=3; None leaves them free to run anywhere
+    STREAM_CPU_AFFINITY: Optional[Set[int]] = None
+
+    # Period size (in frames) of the persistent native playback stream
+    PCM_PERIOD_FRAMES = 1024
+
+    # Bytes handed to each os.sendfile() call when streaming a file to aplay
+    SENDFILE_CHUNK = 1024 * 1024
+
+    # Seconds the aplay pre-started after a stream_play() may wait for the next
+    # one. It holds the output device open, which is exclusive on hw/plughw, so
+    # it exits after this; 0 disables the spare
+    APLAY_SPARE_IDLE_TIMEOUT = 2.0
+
+    # WAV files up to this size are decoded once and kept in memory for replay
+    WAV_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+    # Decoded PCM kept across all cached WAV files; least recently played go first
+    WAV_CACHE_TOTAL_BYTES = 16 * 1024 * 1024
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_raspberry_pi() -> bool:
-        """Check if the current system is a Raspberry Pi."""
+        """Check if the current system is a Raspberry Pi (probed once per process)."""
         try:
             if os.path.exists("/proc/device-tree/model"):
                 with open("/proc/device-tree/model", "r") as f:
@@ -58,10 +337,29 @@ class Audio:
         return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def has_audio_controls() -> bool:
-        """Check if this system has the PamirAI soundcard controls."""
+        """Check if this system has the PamirAI soundcard controls (probed once per process)."""
         return os.path.exists(Audio.MIC_GAIN_PATH) and os.path.exists(Audio.SPEAKER_VOLUME_PATH)
 
+    @staticmethod
+    def invalidate_hw_cache() -> None:
+        """
+        Forget cached hardware probes so they are re-run on next use.
+
+        Call this after the soundcard driver is loaded, a USB soundcard is plugged
+        in, ALSA utils are installed, or the control paths change.
+        """
+        Audio.is_raspberry_pi.cache_clear()
+        Audio.has_audio_controls.cache_clear()
+        _find_alsa_utils.cache_clear()
+        _subproc_cache.invalidate(["arecord", "-l"])
+        for fd in Audio._sysfs_fds.values():
+            if fd is not None:
+                os.close(fd)
+        Audio._sysfs_fds.clear()
+        Audio._sysfs_levels.clear()
+
     def __init__(
         self,
         sample_rate: int = 48000,
@@ -91,6 +389,20 @@ class Audio:
         self.input_device = input_device
         self.output_device = output_device
 
+        # Common arecord/aplay arguments, built once from the settings above
+        self._arecord_argv = (
+            "arecord",
+            "-D",
+            input_device,
+            "-f",
+            format_type,
+            "-r",
+            str(sample_rate),
+            "-c",
+            str(channels),
+        )
+        self._aplay_argv = ("aplay", "-D", output_device)
+
         # Default microphone gain and speaker volume levels
         self._mic_gain = 50
         self._speaker_volume = 60
@@ -101,15 +413,51 @@ class Audio:
         # Recording state
         self._is_recording = False
         self._record_thread: Optional[threading.Thread] = None
-        self._stop_recording = threading.Event()
+        self._record_proc: Optional[subprocess.Popen] = None
+        self._record_future: Optional["Future[str]"] = None
+        self._stream_halt: Optional[threading.Event] = None
+
+        # Streaming health counters reported by get_stream_stats()
+        self._stream_ring: Optional[_SPSCRing] = None
+        self._stream_overruns = 0
+        self._capture_xruns = 0
+        self._playback_underruns = 0
+        self._record_interrupted = False
 
         # Playback state
         self._is_playing = False
-        self._play_thread: Optional[threading.Thread] = None
+        self._play_proc: Optional[subprocess.Popen] = None
         self._stop_playback = threading.Event()
-
-        # Thread synchronization
-        self._lock = threading.Lock()
+        self._play_done = threading.Event()
+        self._play_done.set()
+
+        # Reusable worker threads that pump/reap playback and recording jobs
+        self._play_worker = _JobWorker("audio-playback", drain_at_exit=True)
+        self._record_worker = _JobWorker("audio-record")
+        # Let the workers exit with an instance that is dropped without close()
+        weakref.finalize(self, self._play_worker.close)
+        weakref.finalize(self, self._record_worker.close)
+
+        # Persistent native playback stream (pyalsaaudio), opened on first use and
+        # kept prepared between plays so each play skips device open/setup
+        self._pcm_out: Optional["alsaaudio.PCM"] = None
+        self._pcm_out_format: Optional[Tuple[str, int, int]] = None
+
+        # Idle aplay started after a stream_play() for the next one, with its format.
+        # The lock covers the idle timer, which closes it from its own thread
+        self._aplay_spare: Optional[Tuple[Tuple[str, int, int], subprocess.Popen]] = None
+        self._aplay_spare_timer: Optional[threading.Timer] = None
+        self._aplay_spare_lock = threading.Lock()
+
+        # Output directories already created by record()
+        self._ensured_dirs: Set[str] = set()
+
+        # Decoded WAV files by path, least recently played first:
+        # ((mtime_ns, size), pcm, format, rate, channels)
+        self._wav_cache: OrderedDict[str, Tuple[Tuple[int, int], bytes, str, int, int]] = (
+            OrderedDict()
+        )
+        self._wav_cache_bytes = 0
 
         # Check system configuration
         if auto_check_config:
@@ -159,15 +507,12 @@ class Audio:
         Raises:
             AudioError: If configuration is invalid
         """
-        # Check if arecord and aplay are installed
-        try:
-            subprocess.run(["arecord", "--version"], capture_output=True, check=False)
-        except FileNotFoundError:
+        # Check if arecord and aplay are installed (PATH lookup once per process)
+        arecord_path, aplay_path = _find_alsa_utils()
+        if arecord_path is None:
             raise AudioError("arecord not found. Please install ALSA utils package.")
 
-        try:
-            subprocess.run(["aplay", "--version"], capture_output=True, check=False)
-        except FileNotFoundError:
+        if aplay_path is None:
             raise AudioError("aplay not found. Please install ALSA utils package.")
 
         # Check if input/output paths exist
@@ -183,16 +528,126 @@ class Audio:
                 )
                 print("Volume control features will be disabled.")
 
-        # List available audio devices
+        # List available audio devices (probe shared across instances for a while,
+        # since soundcard hotplug is rare and arecord -l costs a fork+exec)
         try:
-            result = subprocess.run(["arecord", "-l"], capture_output=True, text=True, check=False)
-            if result.returncode != 0 or "no soundcards found" in result.stderr:
+            returncode, _, stderr = _subproc_cache.cached_run(
+                ["arecord", "-l"], ttl=Audio.DEVICE_PROBE_TTL
+            )
+            if returncode != 0 or "no soundcards found" in stderr:
                 print("Warning: No audio input devices detected. Continuing anyway.")
         except Exception as e:
             print(f"Warning: Error checking audio devices: {str(e)}")
 
         return True
 
+    @staticmethod
+    def _sysfs_fd(path: str, flags: int = os.O_RDWR) -> Optional[int]:
+        """
+        Get the cached descriptor for a sysfs control file, opening it on first use.
+
+        Args:
+            path: Path to the sysfs control file
+            flags: Open mode, os.O_RDWR for setters or os.O_RDONLY for getters
+
+        Returns:
+            Optional[int]: File descriptor, or None if the file can't be opened directly
+        """
+        key = (path, flags)
+        if key in Audio._sysfs_fds:
+            return Audio._sysfs_fds[key]
+
+        try:
+            fd: Optional[int] = os.open(path, flags)
+        except FileNotFoundError:
+            return None  # Not cached, the control may appear once the driver loads
+        except OSError:
+            fd = None
+        Audio._sysfs_fds[key] = fd
+        return fd
+
+    @staticmethod
+    def _sysfs_read_fd(path: str) -> Optional[int]:
+        """
+        Get a cached descriptor a sysfs control can be read through.
+
+        Root-owned controls are usually world-readable but not writable, so a
+        read-only descriptor still lets getters skip sudo when setters can't.
+
+        Args:
+            path: Path to the sysfs control file
+
+        Returns:
+            Optional[int]: File descriptor, or None if the file can't be read directly
+        """
+        fd = Audio._sysfs_fd(path)
+        if fd is None:
+            fd = Audio._sysfs_fd(path, os.O_RDONLY)
+        return fd
+
+    @staticmethod
+    def _read_sysfs_level(fd: int, path: str, name: str) -> int:
+        """
+        Read an integer level from a cached sysfs file descriptor.
+
+        Args:
+            fd: File descriptor of the sysfs control file
+            path: Path of the control file
+            name: Human-readable control name for warnings
+
+        Returns:
+            int: Current level, or 0 if the read fails
+        """
+        try:
+            # sysfs attributes are regenerated on every read from offset 0
+            level = int(os.pread(fd, 16, 0))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error getting {name}: {str(e)}")
+            return 0
+
+        Audio._sysfs_levels[path] = level
+        return level
+
+    @staticmethod
+    def _write_sysfs_level(fd: int, path: str, value: int, name: str) -> None:
+        """
+        Write an integer level to a cached sysfs file descriptor.
+
+        Args:
+            fd: File descriptor of the sysfs control file
+            path: Path of the control file
+            value: Level to write
+            name: Human-readable control name for warnings
+        """
+        payload = _LEVEL_BYTES[value] if value < len(_LEVEL_BYTES) else str(value).encode()
+        try:
+            os.pwrite(fd, payload, 0)
+        except OSError as e:
+            Audio._sysfs_levels.pop(path, None)
+            print(f"Warning: Error setting {name}: {str(e)}")
+            return
+
+        Audio._sysfs_levels[path] = value
+
+    @staticmethod
+    def _current_sysfs_level(path: str) -> Optional[int]:
+        """
+        Get the level a sysfs control holds, reading it once if it isn't known yet.
+
+        Args:
+            path: Path of the control file
+
+        Returns:
+            Optional[int]: Current level, or None if it can't be read without sudo
+        """
+        level = Audio._sysfs_levels.get(path)
+        if level is None and (fd := Audio._sysfs_read_fd(path)) is not None:
+            try:
+                level = Audio._sysfs_levels[path] = int(os.pread(fd, 16, 0))
+            except (OSError, ValueError):
+                return None
+        return level
+
     def set_mic_gain(self, gain: int) -> None:
         """
         Set the microphone gain/volume.
@@ -226,17 +681,36 @@ class Audio:
         if not isinstance(gain, int) or gain < 0:
             raise AudioError(f"Invalid gain value: {gain}. Must be a positive integer.")
 
+        # Skip all I/O (including the sudo fallback) if the control already holds it
+        if Audio._current_sysfs_level(Audio.MIC_GAIN_PATH) == gain:
+            return gain
+
+        # Write through the cached descriptor when the control is directly writable
+        fd = Audio._sysfs_fd(Audio.MIC_GAIN_PATH)
+        if fd is not None:
+            Audio._write_sysfs_level(fd, Audio.MIC_GAIN_PATH, gain, "microphone gain")
+            return gain
+
         # If we don't have the control file, just return the requested gain
-        if not os.path.exists(Audio.MIC_GAIN_PATH):
+        if not Audio.has_audio_controls():
             return gain
 
         try:
             # Use sudo to write to the system control file
-            cmd = f"echo {gain} | sudo tee {Audio.MIC_GAIN_PATH} > /dev/null"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=False)
+            result = subprocess.run(
+                ["sudo", "tee", Audio.MIC_GAIN_PATH],
+                input=str(gain),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
 
             if result.returncode != 0:
+                Audio._sysfs_levels.pop(Audio.MIC_GAIN_PATH, None)
                 print(f"Warning: Failed to set microphone gain: {result.stderr}")
+            else:
+                Audio._sysfs_levels[Audio.MIC_GAIN_PATH] = gain
 
             return gain
         except Exception as e:
@@ -270,8 +744,13 @@ class Audio:
         Raises:
             AudioError: If getting the gain fails
         """
+        # Read through the cached descriptor when the control is directly readable
+        fd = Audio._sysfs_read_fd(Audio.MIC_GAIN_PATH)
+        if fd is not None:
+            return Audio._read_sysfs_level(fd, Audio.MIC_GAIN_PATH, "microphone gain")
+
         # If we don't have the control file, return a default value
-        if not os.path.exists(Audio.MIC_GAIN_PATH):
+        if not Audio.has_audio_controls():
             return 0
 
         try:
@@ -285,7 +764,9 @@ class Audio:
                 return 0
 
             # Return the gain value
-            return int(result.stdout.strip())
+            gain = int(result.stdout.strip())
+            Audio._sysfs_levels[Audio.MIC_GAIN_PATH] = gain
+            return gain
 
         except Exception as e:
             print(f"Warning: Error getting microphone gain: {str(e)}")
@@ -324,17 +805,36 @@ class Audio:
         if not isinstance(volume, int) or volume < 0:
             raise AudioError(f"Invalid volume value: {volume}. Must be a positive integer.")
 
+        # Skip all I/O (including the sudo fallback) if the control already holds it
+        if Audio._current_sysfs_level(Audio.SPEAKER_VOLUME_PATH) == volume:
+            return volume
+
+        # Write through the cached descriptor when the control is directly writable
+        fd = Audio._sysfs_fd(Audio.SPEAKER_VOLUME_PATH)
+        if fd is not None:
+            Audio._write_sysfs_level(fd, Audio.SPEAKER_VOLUME_PATH, volume, "speaker volume")
+            return volume
+
         # If we don't have the control file, just return the requested volume
-        if not os.path.exists(Audio.SPEAKER_VOLUME_PATH):
+        if not Audio.has_audio_controls():
             return volume
 
         try:
             # Use sudo to write to the system control file
-            cmd = f"echo {volume} | sudo tee {Audio.SPEAKER_VOLUME_PATH} > /dev/null"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=False)
+            result = subprocess.run(
+                ["sudo", "tee", Audio.SPEAKER_VOLUME_PATH],
+                input=str(volume),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
 
             if result.returncode != 0:
+                Audio._sysfs_levels.pop(Audio.SPEAKER_VOLUME_PATH, None)
                 print(f"Warning: Failed to set speaker volume: {result.stderr}")
+            else:
+                Audio._sysfs_levels[Audio.SPEAKER_VOLUME_PATH] = volume
 
             return volume
         except Exception as e:
@@ -368,8 +868,13 @@ class Audio:
         Raises:
             AudioError: If getting the volume fails
         """
+        # Read through the cached descriptor when the control is directly readable
+        fd = Audio._sysfs_read_fd(Audio.SPEAKER_VOLUME_PATH)
+        if fd is not None:
+            return Audio._read_sysfs_level(fd, Audio.SPEAKER_VOLUME_PATH, "speaker volume")
+
         # If we don't have the control file, return a default value
-        if not os.path.exists(Audio.SPEAKER_VOLUME_PATH):
+        if not Audio.has_audio_controls():
             return 0
 
         try:
@@ -386,16 +891,104 @@ class Audio:
                 return 0
 
             # Return the volume value
-            return int(result.stdout.strip())
+            volume = int(result.stdout.strip())
+            Audio._sysfs_levels[Audio.SPEAKER_VOLUME_PATH] = volume
+            return volume
 
         except Exception as e:
             print(f"Warning: Error getting speaker volume: {str(e)}")
             return 0
 
+    @staticmethod
+    def _terminate_process(proc: Optional[subprocess.Popen]) -> None:
+        """
+        Terminate a child process if it is still running and reap it.
+
+        Args:
+            proc: Process to terminate, or None
+        """
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+
+    @staticmethod
+    def _enter_realtime(priority: int) -> Optional[Tuple[Optional[Set[int]], bool]]:
+        """
+        Move the calling thread to SCHED_FIFO and, if configured, pin it.
+
+        Needs CAP_SYS_NICE or an rtprio limit; without it the thread silently keeps
+        its normal priority.
+
+        Args:
+            priority: SCHED_FIFO priority, or 0 to leave the scheduler alone
+
+        Returns:
+            Optional[Tuple[Optional[Set[int]], bool]]: What to undo in
+            _leave_realtime(): the previous CPU set (None if not pinned) and whether
+            the policy changed; None if nothing changed
+        """
+        if priority <= 0:
+            return None
+
+        affinity = None
+        if Audio.STREAM_CPU_AFFINITY:
+            try:
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, Audio.STREAM_CPU_AFFINITY)
+            except OSError:
+                affinity = None
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            realtime = True
+        except OSError:
+            realtime = False
+
+        return (affinity, realtime) if affinity is not None or realtime else None
+
+    @staticmethod
+    def _leave_realtime(saved: Optional[Tuple[Optional[Set[int]], bool]]) -> None:
+        """
+        Undo _enter_realtime() on the calling thread.
+
+        Args:
+            saved: Value returned by _enter_realtime()
+        """
+        if saved is None:
+            return
+        affinity, realtime = saved
+        try:
+            if realtime:
+                os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+            if affinity is not None:
+                os.sched_setaffinity(0, affinity)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _interrupt_process(proc: Optional[subprocess.Popen]) -> None:
+        """
+        Stop a recording child with SIGINT, which lets arecord finalize the WAV header.
+
+        Args:
+            proc: Process to interrupt, or None
+        """
+        if proc is None or proc.poll() is not None:
+            return
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
     def record(self, filepath: str, duration: Optional[float] = None) -> str:
         """
         Record audio to a file.
 
+        With a duration this blocks until the recording is complete; without one it
+        returns immediately and records until stop_recording() is called.
+
         Args:
             filepath: Path to save the recorded audio
             duration: Recording duration in seconds, or None for manual stop
@@ -406,27 +999,43 @@ class Audio:
         Raises:
             AudioError: If recording fails
         """
+        future = self.record_async(filepath, duration)
+        if duration is not None:
+            return future.result()
+        return filepath
+
+    def record_async(self, filepath: str, duration: Optional[float] = None) -> "Future[str]":
+        """
+        Start recording audio to a file without blocking.
+
+        Args:
+            filepath: Path to save the recorded audio
+            duration: Recording duration in seconds, or None for manual stop
+
+        Returns:
+            Future[str]: Resolves to the file path once arecord exits, or raises
+            AudioError if it failed
+
+        Raises:
+            AudioError: If recording can't be started
+        """
         if self._is_recording:
             raise AudioError("Recording already in progress")
 
         if duration is not None and not isinstance(duration, (int, float)):
             raise AudioError(f"Invalid duration: {duration}. Must be a number or None.")
 
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        # Ensure the directory exists (once per directory for this instance). Relative
+        # paths are keyed by their absolute form so a chdir() can't hit a stale entry.
+        directory = os.path.dirname(
+            filepath if os.path.isabs(filepath) else os.path.abspath(filepath)
+        )
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
 
         # Build command
-        cmd = [
-            "arecord",
-            "-D",
-            self.input_device,
-            "-f",
-            self.format_type,
-            "-r",
-            str(self.sample_rate),
-            "-c",
-            str(self.channels),
-        ]
+        cmd = [*self._arecord_argv]
 
         # Add duration if specified
         if duration is not None:
@@ -436,38 +1045,30 @@ class Audio:
         cmd.append(filepath)
 
         try:
-            with self._lock:
-                self._is_recording = True
-                self._stop_recording.clear()
-
-                if duration is None:
-                    # For manual stop, run in a thread
-                    def record_thread():
-                        proc = subprocess.Popen(cmd)
-                        # Wait for stop event
-                        while not self._stop_recording.is_set():
-                            if proc.poll() is not None:
-                                break
-                            time.sleep(0.1)
-                        # Kill if still running
-                        if proc.poll() is None:
-                            proc.terminate()
-                            proc.wait()
-
-                    self._record_thread = threading.Thread(target=record_thread)
-                    self._record_thread.start()
-                    return filepath
-                else:
-                    # For fixed duration, run synchronously
-                    subprocess.run(cmd, check=True)
-                    self._is_recording = False
-                    return filepath
-
+            proc = subprocess.Popen(cmd)
         except Exception as e:
-            self._is_recording = False
-            self._stop_recording.set()
             raise AudioError(f"Recording failed: {str(e)}")
 
+        future: "Future[str]" = Future()
+        self._is_recording = True
+        self._record_interrupted = False
+        self._record_proc = proc
+        self._record_future = future
+
+        def record_job():
+            # Reap arecord and resolve the future; stop_recording() signals it directly
+            returncode = proc.wait()
+            self._is_recording = False
+            if returncode == 0 or self._record_interrupted:
+                future.set_result(filepath)
+            else:
+                future.set_exception(
+                    AudioError(f"Recording failed: arecord exited with status {returncode}")
+                )
+
+        self._record_worker.submit(record_job)
+        return future
+
     def stop_recording(self) -> None:
         """
         Stop an ongoing recording.
@@ -478,17 +1079,24 @@ class Audio:
         if not self._is_recording:
             raise AudioError("No recording in progress")
 
-        with self._lock:
-            self._stop_recording.set()
-            if self._record_thread and self._record_thread.is_alive():
-                self._record_thread.join(timeout=2)
-            self._is_recording = False
+        self._record_interrupted = True
+        if self._stream_halt is not None:
+            self._stream_halt.set()
+        Audio._interrupt_process(self._record_proc)
+        if self._record_thread and self._record_thread.is_alive():
+            self._record_thread.join(timeout=2)
+        elif self._record_future is not None:
+            wait([self._record_future], timeout=2)
+        self._is_recording = False
 
     def stream_record(
         self,
-        callback: Callable[[bytes], None],
+        callback: Callable[[Union[bytes, memoryview]], None],
         buffer_size: int = 4096,
         stop_event: Optional[threading.Event] = None,
+        zero_copy: bool = False,
+        rt_priority: Optional[int] = None,
+        on_overrun: str = "drop_oldest",
     ) -> threading.Thread:
         """
         Record audio to a stream for real-time processing.
@@ -497,6 +1105,13 @@ class Audio:
             callback: Function to call with each audio buffer
             buffer_size: Size of audio buffer in bytes
             stop_event: Event to signal when recording should stop
+            zero_copy: Pass the callback a memoryview into the internal ring instead
+                of a bytes copy. The view is only valid until the callback returns.
+            rt_priority: SCHED_FIFO priority for the reader thread (default:
+                STREAM_RT_PRIORITY, 0 to keep the normal scheduler)
+            on_overrun: What to lose when the callback falls STREAM_RING_SLOTS
+                buffers behind: "drop_oldest" (skip ahead to fresh audio),
+                "drop_newest" or "block" (stall capture until the callback catches up)
 
         Returns:
             threading.Thread: The recording thread
@@ -510,53 +1125,262 @@ class Audio:
         if not callable(callback):
             raise AudioError("Callback must be a callable function")
 
-        # Use provided stop event or create one
-        self._stop_recording = stop_event if stop_event is not None else threading.Event()
-
-        # Build command
-        cmd = [
-            "arecord",
-            "-D",
-            self.input_device,
-            "-f",
-            self.format_type,
-            "-r",
-            str(self.sample_rate),
-            "-c",
-            str(self.channels),
-        ]
+        if on_overrun not in _SPSCRing.POLICIES:
+            raise AudioError(
+                f"Invalid on_overrun: {on_overrun}. Must be one of {', '.join(_SPSCRing.POLICIES)}."
+            )
 
-        def stream_thread():
+        # Use provided stop event or create one; halt is set by stop_recording()
+        stop = stop_event if stop_event is not None else threading.Event()
+        halt = threading.Event()
+
+        # Match ALSA's period to one callback buffer so capture hands over whole
+        # buffers instead of the default ~500 ms of buffering
+        period_frames = 0
+        if self.format_type in _FORMAT_SAMPLE_BYTES:
+            period_frames = buffer_size // (_FORMAT_SAMPLE_BYTES[self.format_type] * self.channels)
+
+        # The reader drains capture into the ring as fast as ALSA fills it, so a
+        # slow callback can no longer back-pressure the capture and cause xruns
+        ring = _SPSCRing(Audio.STREAM_RING_SLOTS, buffer_size, on_overrun)
+
+        # Open capture on the caller's thread so stop_recording() can always reach it
+        process: Optional[subprocess.Popen] = None
+        pcm: Optional["alsaaudio.PCM"] = None
+        if ALSAAUDIO_AVAILABLE and period_frames > 0:
+            # Native capture: periods are read straight from the ALSA ring, with
+            # no arecord child and no pipe in between
             try:
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
-                self._is_recording = True
+                pcm = alsaaudio.PCM(
+                    type=alsaaudio.PCM_CAPTURE,
+                    device=self.input_device,
+                    rate=self.sample_rate,
+                    channels=self.channels,
+                    format=getattr(alsaaudio, f"PCM_FORMAT_{self.format_type}"),
+                    periodsize=period_frames,
+                    periods=Audio.STREAM_PERIODS,
+                )
+            except Exception as e:
+                raise AudioError(f"Stream recording failed: {str(e)}")
+
+            def read_chunk(views: List[memoryview]) -> int:
+                # One period per read; pyalsaaudio has no read-into-buffer API
+                while not halt.is_set():
+                    length, data = pcm.read()
+                    if length >= 0:
+                        views[0][: len(data)] = data
+                        return len(data)
+                    # Negative length reports an overrun; the PCM is already re-prepared
+                    self._capture_xruns += 1
+                return 0
+
+        else:
+            process = self._start_stream_arecord(buffer_size, period_frames)
+            assert process.stdout is not None  # Started with stdout=PIPE
+            pipe_fd = process.stdout.fileno()
+
+            def read_chunk(views: List[memoryview]) -> int:
+                # Scatter-read: when the reader fell behind, one syscall drains
+                # every buffer waiting in the pipe into consecutive slots
+                return os.readv(pipe_fd, views)
+
+        self._record_proc = process
+        self._stream_halt = halt
+        self._stream_ring = ring
+
+        def release_capture():
+            halt.set()
+            Audio._terminate_process(process)
+
+        def reader_thread():
+            # Run the reader at real-time priority so capture is drained on time
+            # even when the CPU is busy
+            Audio._enter_realtime(Audio.STREAM_RT_PRIORITY if rt_priority is None else rt_priority)
+
+            # Scratch slot used to keep draining the pipe while the ring is full
+            overflow = [memoryview(bytearray(buffer_size))]
 
-                while not self._stop_recording.is_set():
-                    # Read from stdout pipe
-                    audio_data = process.stdout.read(buffer_size)
-                    if not audio_data:
+            # Overruns are reported at most once a second, never per buffer
+            reported = 0
+            report_at = time.monotonic()
+
+            try:
+                while not stop.is_set() and not halt.is_set():
+                    # Read straight into the next free slots (at most what the pipe
+                    # can hold); the buffer is dropped if the callback has fallen a
+                    # full ring behind
+                    slots = ring.reserve(Audio.STREAM_PERIODS)
+                    read = read_chunk(slots or overflow)
+                    if not read:
                         break
-                    # Call the callback with the audio data
-                    callback(audio_data)
+                    if slots:
+                        ring.commit(read)
 
+                    if ring.lost != reported and time.monotonic() >= report_at:
+                        print(
+                            f"Warning: Stream callback fell behind, dropped "
+                            f"{ring.lost - reported} audio buffers ({on_overrun})"
+                        )
+                        reported = ring.lost
+                        report_at = time.monotonic() + 1.0
+
+            except Exception as e:
+                print(f"Stream recording error: {str(e)}")
+            finally:
                 # Clean up
-                if process.poll() is None:
-                    process.terminate()
-                    process.wait()
+                release_capture()
+                if pcm is not None:
+                    pcm.close()
+                ring.close()
 
+        def callback_thread():
+            try:
+                while (audio_data := ring.peek()) is not None:
+                    # Call the callback with the audio data
+                    callback(audio_data if zero_copy else audio_data.tobytes())
+                    ring.release()
+            except Exception as e:
+                print(f"Stream recording error: {str(e)}")
+                # Stop the reader too, nothing is consuming its output any more
+                release_capture()
+            finally:
+                ring.cancel()
+                self._stream_overruns += ring.lost
+                self._stream_ring = None
                 self._is_recording = False
 
+        self._is_recording = True
+
+        # Start threads; the callback thread is returned so join() waits for
+        # every captured buffer to be delivered
+        reader = threading.Thread(target=reader_thread, daemon=True)
+        self._record_thread = threading.Thread(target=callback_thread, daemon=True)
+        reader.start()
+        self._record_thread.start()
+
+        return self._record_thread
+
+    def stream_record_to_fd(
+        self,
+        dst_fd: int,
+        buffer_size: int = 4096,
+        stop_event: Optional[threading.Event] = None,
+    ) -> threading.Thread:
+        """
+        Record raw audio straight into a file descriptor (file, socket or pipe).
+
+        For regular files and pipes the audio is moved from arecord's pipe with
+        os.splice, so it never enters Python. Sockets (and files splice rejects,
+        such as O_APPEND ones) use a read/write loop through one reused buffer,
+        because a splice blocked on a full socket holds the pipe lock and would
+        leave arecord unkillable until the socket drains.
+
+        Args:
+            dst_fd: Open, writable file descriptor to receive the audio
+            buffer_size: Maximum bytes moved per transfer
+            stop_event: Event to signal when recording should stop
+
+        Returns:
+            threading.Thread: The forwarding thread; it exits once recording stops
+
+        Raises:
+            AudioError: If dst_fd isn't an open file descriptor or recording fails
+        """
+        if self._is_recording:
+            raise AudioError("Recording already in progress")
+
+        stop = stop_event if stop_event is not None else threading.Event()
+        halt = threading.Event()
+
+        period_frames = 0
+        if self.format_type in _FORMAT_SAMPLE_BYTES:
+            period_frames = buffer_size // (_FORMAT_SAMPLE_BYTES[self.format_type] * self.channels)
+
+        # Check the destination before arecord starts, so a bad fd leaves nothing running
+        try:
+            dst_mode = os.fstat(dst_fd).st_mode
+        except OSError as e:
+            raise AudioError(f"Invalid destination file descriptor {dst_fd}: {str(e)}")
+        use_splice = stat.S_ISREG(dst_mode) or stat.S_ISFIFO(dst_mode)
+
+        process = self._start_stream_arecord(buffer_size, period_frames)
+        self._record_proc = process
+        self._stream_halt = halt
+
+        def forward_thread():
+            nonlocal use_splice
+            src_fd = process.stdout.fileno()
+            buffer = bytearray(buffer_size)
+            try:
+                while not stop.is_set() and not halt.is_set():
+                    if use_splice:
+                        try:
+                            moved = os.splice(src_fd, dst_fd, buffer_size)
+                        except OSError as e:
+                            if e.errno != errno.EINVAL:
+                                raise
+                            use_splice = False  # Destination doesn't support splice
+                            continue
+                    else:
+                        moved = os.readv(src_fd, [buffer])
+                        view = memoryview(buffer)[:moved]
+                        while view:
+                            view = view[os.write(dst_fd, view) :]
+                    if not moved:
+                        break
             except Exception as e:
-                self._is_recording = False
                 print(f"Stream recording error: {str(e)}")
+            finally:
+                halt.set()
+                Audio._terminate_process(process)
+                self._is_recording = False
 
-        # Start thread
-        self._record_thread = threading.Thread(target=stream_thread)
-        self._record_thread.daemon = True
+        self._is_recording = True
+        self._record_thread = threading.Thread(target=forward_thread, daemon=True)
         self._record_thread.start()
 
         return self._record_thread
 
+    def _start_stream_arecord(self, buffer_size: int, period_frames: int) -> subprocess.Popen:
+        """
+        Start arecord writing raw audio to a pipe for the streaming recorders.
+
+        Args:
+            buffer_size: Bytes per callback buffer
+            period_frames: ALSA period matching one buffer, or 0 for arecord's default
+
+        Returns:
+            subprocess.Popen: arecord process with a stdout pipe
+
+        Raises:
+            AudioError: If arecord can't be started
+        """
+        cmd = [*self._arecord_argv]
+        if period_frames > 0:
+            cmd.extend(
+                [
+                    f"--period-size={period_frames}",
+                    f"--buffer-size={period_frames * Audio.STREAM_PERIODS}",
+                ]
+            )
+
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        except Exception as e:
+            raise AudioError(f"Stream recording failed: {str(e)}")
+
+        # Size the pipe to a few callback buffers rather than the 64 KiB
+        # default (~340 ms of 48 kHz stereo S16), bounding capture latency
+        assert process.stdout is not None  # Started with stdout=PIPE
+        try:
+            fcntl.fcntl(
+                process.stdout.fileno(), fcntl.F_SETPIPE_SZ, buffer_size * Audio.STREAM_PERIODS
+            )
+        except OSError:
+            pass
+
+        return process
+
     def play(self, filepath: str) -> None:
         """
         Play audio from a file.
@@ -570,39 +1394,119 @@ class Audio:
         if self._is_playing:
             raise AudioError("Playback already in progress")
 
-        if not os.path.exists(filepath):
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
             raise AudioError(f"Audio file not found: {filepath}")
 
+        # Short clips (UI sounds, prompts) are decoded once and replayed from memory
+        # as raw PCM, so repeat plays skip the file open and WAV header parse
+        if file_stat.st_size <= Audio.WAV_CACHE_MAX_BYTES:
+            cached = self._load_wav(filepath, (file_stat.st_mtime_ns, file_stat.st_size))
+            if cached is not None:
+                self.stream_play(*cached)
+                return
+
+        if ALSAAUDIO_AVAILABLE:
+            try:
+                wav = wave.open(filepath, "rb")
+            except (wave.Error, EOFError):
+                wav = None  # Not a PCM WAV file, let aplay handle it
+            except OSError as e:
+                raise AudioError(f"Playback failed: {str(e)}")
+
+            if wav is not None:
+                try:
+                    fmt = _WAV_SAMPLE_FORMATS.get(wav.getsampwidth())
+                    if fmt is not None:
+                        self._play_native(
+                            Audio._wav_chunks(wav, Audio.PCM_PERIOD_FRAMES),
+                            fmt,
+                            wav.getframerate(),
+                            wav.getnchannels(),
+                        )
+                        wav = None  # The playback job reads and closes it now
+                        return
+                finally:
+                    if wav is not None:
+                        wav.close()
+
         # Build command
-        cmd = ["aplay", "-D", self.output_device, filepath]
+        cmd = [*self._aplay_argv, filepath]
 
         try:
-            with self._lock:
-                self._is_playing = True
-                self._stop_playback.clear()
-
-                def play_thread():
-                    proc = subprocess.Popen(cmd)
-                    # Wait for stop event or completion
-                    while not self._stop_playback.is_set():
-                        if proc.poll() is not None:
-                            break
-                        time.sleep(0.1)
-                    # Kill if still running
-                    if proc.poll() is None:
-                        proc.terminate()
-                        proc.wait()
+            self._begin_playback()
 
-                    with self._lock:
-                        self._is_playing = False
+            # The output device is opened exclusively, so release it first
+            self._close_pcm_out()
+            self._close_aplay_spare()
+            proc = subprocess.Popen(cmd)
+            self._play_proc = proc
 
-                self._play_thread = threading.Thread(target=play_thread)
-                self._play_thread.start()
+            def play_job():
+                # Block until aplay exits; stop_playback() terminates it directly
+                proc.wait()
+
+                self._end_playback()
+
+            self._play_worker.submit(play_job)
 
         except Exception as e:
-            self._is_playing = False
+            self._end_playback()
             raise AudioError(f"Playback failed: {str(e)}")
 
+    def _load_wav(
+        self, filepath: str, signature: Tuple[int, int]
+    ) -> Optional[Tuple[bytes, str, int, int]]:
+        """
+        Get the raw PCM and stream parameters of a WAV file, using the cache if fresh.
+
+        Args:
+            filepath: Path to the WAV file
+            signature: (mtime_ns, size) of the file, used to detect rewrites
+
+        Returns:
+            Optional[Tuple[bytes, str, int, int]]: (pcm, format, rate, channels), or None
+            if the file isn't a PCM WAV file we can stream
+        """
+        cached = self._wav_cache.get(filepath)
+        if cached is not None:
+            if cached[0] == signature:
+                self._wav_cache.move_to_end(filepath)
+                return cached[1:]
+            # The file was rewritten since it was cached
+            del self._wav_cache[filepath]
+            self._wav_cache_bytes -= len(cached[1])
+
+        try:
+            with wave.open(filepath, "rb") as wav:
+                fmt = _WAV_SAMPLE_FORMATS.get(wav.getsampwidth())
+                if fmt is None:
+                    return None
+                pcm = wav.readframes(wav.getnframes())
+                rate = wav.getframerate()
+                channels = wav.getnchannels()
+        except (wave.Error, EOFError):
+            return None
+
+        self._wav_cache[filepath] = (signature, pcm, fmt, rate, channels)
+        self._wav_cache_bytes += len(pcm)
+        while self._wav_cache_bytes > Audio.WAV_CACHE_TOTAL_BYTES:
+            _, evicted = self._wav_cache.popitem(last=False)
+            self._wav_cache_bytes -= len(evicted[1])
+        return pcm, fmt, rate, channels
+
+    def _begin_playback(self) -> None:
+        """Mark playback as started; only called from the caller's thread."""
+        self._is_playing = True
+        self._stop_playback.clear()
+        self._play_done.clear()
+
+    def _end_playback(self) -> None:
+        """Mark playback as finished and wake anyone waiting in stop_playback()."""
+        self._is_playing = False
+        self._play_done.set()
+
     def stop_playback(self) -> None:
         """
         Stop an ongoing playback.
@@ -613,10 +1517,9 @@ class Audio:
         if not self._is_playing:
             raise AudioError("No playback in progress")
 
-        with self._lock:
-            self._stop_playback.set()
-            if self._play_thread and self._play_thread.is_alive():
-                self._play_thread.join(timeout=2)
+        self._stop_playback.set()
+        Audio._terminate_process(self._play_proc)
+        self._play_done.wait(timeout=2)
 
     def stream_play(
         self,
@@ -624,6 +1527,8 @@ class Audio:
         format_type: Optional[str] = None,
         sample_rate: Optional[int] = None,
         channels: Optional[int] = None,
+        rt_priority: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
         """
         Play audio from a stream (bytes or file-like object).
@@ -633,6 +1538,11 @@ class Audio:
             format_type: Audio format override (default: use instance format)
             sample_rate: Sample rate override (default: use instance rate)
             channels: Channels override (default: use instance channels)
+            rt_priority: SCHED_FIFO priority for the native writer (default:
+                STREAM_RT_PRIORITY, 0 to keep the normal scheduler). Not used with
+                aplay, which keeps its own timing.
+            chunk_size: Bytes per write to aplay (default: STREAM_PERIODS periods of
+                PCM_PERIOD_FRAMES frames). The native path always writes one period.
 
         Raises:
             AudioError: If playback fails or another playback is in progress
@@ -645,55 +1555,315 @@ class Audio:
         rate = sample_rate or self.sample_rate
         chans = channels or self.channels
 
-        # Build command
-        cmd = ["aplay", "-D", self.output_device, "-f", fmt, "-r", str(rate), "-c", str(chans)]
+        # One ALSA period of this stream, or 4 KiB for formats we can't size
+        period_bytes = Audio.PCM_PERIOD_FRAMES * _FORMAT_SAMPLE_BYTES.get(fmt, 0) * chans or 4096
+
+        if ALSAAUDIO_AVAILABLE and fmt in _FORMAT_SAMPLE_BYTES:
+            self._play_native(
+                Audio._stream_chunks(audio_data, period_bytes),
+                fmt,
+                rate,
+                chans,
+                Audio.STREAM_RT_PRIORITY if rt_priority is None else rt_priority,
+            )
+            return
 
         try:
-            with self._lock:
-                self._is_playing = True
-                self._stop_playback.clear()
-
-                def play_thread():
-                    # Create a subprocess
-                    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-
-                    try:
-                        # Handle different input types
-                        if isinstance(audio_data, bytes):
-                            proc.stdin.write(audio_data)
-                            proc.stdin.close()
-                        else:
-                            # Assume file-like object
-                            while chunk := audio_data.read(4096):
-                                if self._stop_playback.is_set():
-                                    break
-                                proc.stdin.write(chunk)
-                            proc.stdin.close()
-
-                        # Wait for process to complete
-                        while not self._stop_playback.is_set():
-                            if proc.poll() is not None:
+            self._begin_playback()
+
+            # Reuse the pre-started aplay if it matches, so the device is already open;
+            # the native stream would hold it open otherwise
+            self._close_pcm_out()
+            proc = self._take_aplay((fmt, rate, chans))
+            self._play_proc = proc
+
+            def play_job():
+                try:
+                    # Handle different input types
+                    out_fd = proc.stdin.fileno()
+                    if (in_fd := Audio._real_fileno(audio_data)) is not None:
+                        # Regular file: let the kernel copy page cache -> pipe
+                        offset = audio_data.tell()
+                        end = os.fstat(in_fd).st_size
+                        while offset < end and not self._stop_playback.is_set():
+                            sent = os.sendfile(
+                                out_fd, in_fd, offset, min(Audio.SENDFILE_CHUNK, end - offset)
+                            )
+                            if not sent:
                                 break
-                            time.sleep(0.1)
+                            offset += sent
+                        audio_data.seek(offset)
+                        proc.stdin.close()
+                    else:
+                        # Bytes or other file-like object: write views straight to
+                        # the pipe fd, bypassing the BufferedWriter copy
+                        # Whole periods per write keep pipe syscalls to a few per second
+                        write_size = chunk_size or period_bytes * Audio.STREAM_PERIODS
+                        for chunk in Audio._stream_chunks(audio_data, write_size):
+                            if self._stop_playback.is_set():
+                                break
+                            while chunk:
+                                chunk = chunk[os.write(out_fd, chunk) :]
+                        proc.stdin.close()
+
+                    # Wait for aplay to drain; stop_playback() terminates it directly
+                    proc.wait()
 
-                    except Exception as e:
+                except BrokenPipeError as e:
+                    # Expected when stop_playback() terminates aplay mid-write
+                    if not self._stop_playback.is_set():
                         print(f"Stream playback error: {str(e)}")
-                    finally:
-                        # Ensure process is terminated
-                        if proc.poll() is None:
-                            proc.terminate()
-                            proc.wait()
+                except Exception as e:
+                    print(f"Stream playback error: {str(e)}")
+                finally:
+                    # Ensure process is terminated
+                    Audio._terminate_process(proc)
 
-                        with self._lock:
-                            self._is_playing = False
+                    # Start the next aplay now, while the caller isn't waiting on it
+                    self._prime_aplay((fmt, rate, chans))
+                    self._end_playback()
 
-                self._play_thread = threading.Thread(target=play_thread)
-                self._play_thread.start()
+            self._play_worker.submit(play_job)
 
         except Exception as e:
-            self._is_playing = False
+            self._end_playback()
             raise AudioError(f"Stream playback failed: {str(e)}")
 
+    def _take_aplay(self, stream_format: Tuple[str, int, int]) -> subprocess.Popen:
+        """
+        Get an aplay process reading raw audio from stdin in the given format.
+
+        Uses the pre-started spare when its format matches and it is still alive,
+        otherwise starts a new one.
+
+        Args:
+            stream_format: (format, rate, channels) of the audio to be played
+
+        Returns:
+            subprocess.Popen: aplay process with a stdin pipe
+        """
+        spare = self._pop_aplay_spare()
+        if spare is not None:
+            if spare[0] == stream_format and spare[1].poll() is None:
+                return spare[1]
+            Audio._discard_aplay(spare[1])
+
+        fmt, rate, chans = stream_format
+        cmd = [*self._aplay_argv, "-f", fmt, "-r", str(rate), "-c", str(chans)]
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def _prime_aplay(self, stream_format: Tuple[str, int, int]) -> None:
+        """
+        Start a spare aplay for the next stream_play() so its fork, exec and
+        device open happen between plays instead of before the first sound.
+
+        The spare is closed again after APLAY_SPARE_IDLE_TIMEOUT seconds, so the
+        device is only held while plays follow each other closely.
+
+        Args:
+            stream_format: (format, rate, channels) the spare should expect
+        """
+        timeout = Audio.APLAY_SPARE_IDLE_TIMEOUT
+        if timeout <= 0 or self._aplay_spare is not None:
+            return
+        try:
+            proc = self._take_aplay(stream_format)
+        except Exception as e:
+            print(f"Warning: Could not pre-start aplay: {str(e)}")
+            return
+
+        timer = threading.Timer(timeout, self._close_aplay_spare)
+        timer.daemon = True
+        with self._aplay_spare_lock:
+            self._aplay_spare = (stream_format, proc)
+            self._aplay_spare_timer = timer
+        timer.start()
+
+    def _pop_aplay_spare(self) -> Optional[Tuple[Tuple[str, int, int], subprocess.Popen]]:
+        """Take the spare aplay, if any, and cancel its idle timeout."""
+        with self._aplay_spare_lock:
+            spare, self._aplay_spare = self._aplay_spare, None
+            timer, self._aplay_spare_timer = self._aplay_spare_timer, None
+        if timer is not None:
+            timer.cancel()
+        return spare
+
+    def _close_aplay_spare(self) -> None:
+        """Stop the spare aplay process, if any."""
+        spare = self._pop_aplay_spare()
+        if spare is not None:
+            Audio._discard_aplay(spare[1])
+
+    @staticmethod
+    def _discard_aplay(proc: subprocess.Popen) -> None:
+        """Close an unused aplay's stdin (it exits on EOF) and reap it."""
+        if proc.stdin is not None:
+            proc.stdin.close()
+        Audio._terminate_process(proc)
+
+    @staticmethod
+    def _stream_chunks(
+        audio_data: Union[bytes, BinaryIO], size: int
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Split audio data into chunks without allocating per chunk where possible.
+
+        Bytes are sliced as memoryviews; readable streams are read into one reused
+        buffer, so each chunk is only valid until the next one is requested.
+
+        Args:
+            audio_data: Audio data as bytes or file-like object
+            size: Maximum chunk size in bytes
+        """
+        if isinstance(audio_data, bytes):
+            data = memoryview(audio_data)
+            for i in range(0, len(data), size):
+                yield data[i : i + size]
+            return
+
+        readinto = getattr(audio_data, "readinto", None)
+        if readinto is None:
+            yield from iter(lambda: audio_data.read(size), b"")
+            return
+
+        view = memoryview(bytearray(size))
+        while read := readinto(view):
+            yield view[:read]
+
+    @staticmethod
+    def _real_fileno(stream: BinaryIO) -> Optional[int]:
+        """
+        Get the descriptor of a regular file backing a file-like object.
+
+        Args:
+            stream: File-like object
+
+        Returns:
+            Optional[int]: File descriptor, or None for in-memory or non-regular streams
+        """
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        return fd if stat.S_ISREG(os.fstat(fd).st_mode) else None
+
+    @staticmethod
+    def _wav_chunks(wav: wave.Wave_read, frames: int) -> Iterator[bytes]:
+        """
+        Yield raw PCM frames from an open WAV file, closing it when exhausted.
+
+        Args:
+            wav: Open WAV reader
+            frames: Number of frames per chunk
+        """
+        with wav:
+            while chunk := wav.readframes(frames):
+                yield chunk
+
+    def _get_pcm_out(self, fmt: str, rate: int, channels: int) -> "alsaaudio.PCM":
+        """
+        Get the persistent playback PCM, reopening it only if the stream format changed.
+
+        Args:
+            fmt: ALSA sample format name (e.g. S16_LE)
+            rate: Sample rate in Hz
+            channels: Number of channels
+
+        Returns:
+            alsaaudio.PCM: Prepared playback handle
+        """
+        stream_format = (fmt, rate, channels)
+        if self._pcm_out is None or self._pcm_out_format != stream_format:
+            self._close_pcm_out()
+            # A spare aplay holds the device open, and plughw devices are exclusive
+            self._close_aplay_spare()
+            self._pcm_out = alsaaudio.PCM(
+                type=alsaaudio.PCM_PLAYBACK,
+                device=self.output_device,
+                rate=rate,
+                channels=channels,
+                format=getattr(alsaaudio, f"PCM_FORMAT_{fmt}"),
+                periodsize=Audio.PCM_PERIOD_FRAMES,
+            )
+            self._pcm_out_format = stream_format
+        return self._pcm_out
+
+    def _close_pcm_out(self) -> None:
+        """Close the persistent playback PCM, dropping any frames still queued."""
+        if self._pcm_out is not None:
+            self._pcm_out.close()
+        self._pcm_out = None
+        self._pcm_out_format = None
+
+    def _play_native(
+        self,
+        chunks: Iterator[Union[bytes, memoryview]],
+        fmt: str,
+        rate: int,
+        channels: int,
+        rt_priority: int = 0,
+    ) -> None:
+        """
+        Play audio chunks through the persistent native playback stream.
+
+        Args:
+            chunks: Iterator of raw PCM chunks, ideally one period each
+            fmt: ALSA sample format name
+            rate: Sample rate in Hz
+            channels: Number of channels
+            rt_priority: SCHED_FIFO priority while writing, 0 for the normal scheduler
+
+        Raises:
+            AudioError: If the playback device can't be opened
+        """
+        try:
+            self._begin_playback()
+            self._play_proc = None
+
+            pcm = self._get_pcm_out(fmt, rate, channels)
+
+            def play_job():
+                # The worker thread is shared, so real-time scheduling only lasts
+                # for this job
+                saved = Audio._enter_realtime(rt_priority)
+                try:
+                    # Blocking writes pace the loop to the device clock
+                    for chunk in chunks:
+                        if self._stop_playback.is_set():
+                            break
+                        if not pcm.write(chunk) and len(chunk):
+                            # Nothing written: the device underran and was
+                            # re-prepared, so queue the chunk again
+                            self._playback_underruns += 1
+                            pcm.write(chunk)
+                    else:
+                        # Play out what is still buffered, including a final partial
+                        # period, before playback counts as finished. The next
+                        # write() re-prepares the stream. Without drain()
+                        # (pyalsaaudio < 0.10), closing the handle drains it instead
+                        if hasattr(pcm, "drain"):
+                            pcm.drain()
+                        else:
+                            self._close_pcm_out()
+                except Exception as e:
+                    print(f"Stream playback error: {str(e)}")
+                finally:
+                    # Close the WAV file (or other source) if the loop ended early
+                    close = getattr(chunks, "close", None)
+                    if close is not None:
+                        close()
+                    Audio._leave_realtime(saved)
+                    if self._stop_playback.is_set():
+                        # Closing the handle discards audio still in the device buffer
+                        self._close_pcm_out()
+                    self._end_playback()
+
+            self._play_worker.submit(play_job)
+
+        except Exception as e:
+            self._end_playback()
+            raise AudioError(f"Playback failed: {str(e)}")
+
     def is_recording(self) -> bool:
         """
         Check if recording is in progress.
@@ -712,6 +1882,23 @@ class Audio:
         """
         return self._is_playing
 
+    def get_stream_stats(self) -> Dict[str, int]:
+        """
+        Get streaming health counters for this instance.
+
+        Returns:
+            Dict[str, int]: ``overruns`` (stream_record buffers dropped because the
+            callback fell behind, including the stream in progress), ``capture_xruns``
+            (ALSA capture overruns reported by native capture) and
+            ``playback_underruns`` (ALSA underruns hit by native playback)
+        """
+        ring = self._stream_ring
+        return {
+            "overruns": self._stream_overruns + (ring.lost if ring is not None else 0),
+            "capture_xruns": self._capture_xruns,
+            "playback_underruns": self._playback_underruns,
+        }
+
     def close(self) -> None:
         """
         Clean up resources.
@@ -721,3 +1908,8 @@ class Audio:
 
         if self._is_playing:
             self.stop_playback()
+
+        self._close_pcm_out()
+        self._close_aplay_spare()
+        self._play_worker.close()
+        self._record_worker.close()
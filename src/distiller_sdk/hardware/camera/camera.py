@@ -3,24 +3,240 @@
 Camera module for Raspberry Pi Camera integration.
 Part of the CM5 SDK for controlling and interacting with Raspberry Pi Camera.
 
-This module uses rpicam-apps (modern CLI tools for Raspberry Pi OS Bookworm+)
-for reliable camera operations on Raspberry Pi hardware.
+This module uses the libcamera Python bindings (Picamera2) when they are
+installed, and rpicam-apps (modern CLI tools for Raspberry Pi OS Bookworm+)
+otherwise, for reliable camera operations on Raspberry Pi hardware.
 """
 
 import os
+import sys
 import time
 import subprocess
 import threading
+import io
 import cv2  # type: ignore
 import numpy as np
-import tempfile
 import shutil
 import logging
-from typing import Optional, Tuple, Union, List, Callable
+from typing import Any, Dict, Optional, Sequence, Set, Tuple, Union, List, Callable
+
+from distiller_sdk.hardware import _subproc_cache
+
+try:
+    from picamera2 import Picamera2  # type: ignore
+    from libcamera import Transform  # type: ignore
+
+    PICAMERA2_AVAILABLE = True
+except ImportError:
+    Picamera2 = None
+    Transform = None
+    PICAMERA2_AVAILABLE = False
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Picamera2 main-stream format per output format. libcamera names formats by
+# word order, so "RGB888" arrays are B, G, R in memory and "BGR888" are R, G, B.
+# Gray uses the Y plane of YUV420 as is.
+_PICAMERA2_FORMATS = {"bgr": "RGB888", "rgb": "BGR888", "gray": "YUV420"}
+
+# Scaled-IDCT decode flags, largest reduction first
+_REDUCED_COLOR_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+_REDUCED_GRAYSCALE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+# JPEG decode flags per output format: (full size, scaled-IDCT table). Each
+# decodes straight to the output layout, so no cvtColor pass follows. "rgb" is
+# only present on OpenCV builds with IMREAD_COLOR_RGB; older ones decode BGR
+# and convert.
+_JPEG_DECODE_FLAGS: Dict[str, Tuple[int, Tuple[Tuple[int, int], ...]]] = {
+    "bgr": (cv2.IMREAD_COLOR, _REDUCED_COLOR_FLAGS),
+    "gray": (cv2.IMREAD_GRAYSCALE, _REDUCED_GRAYSCALE_FLAGS),
+}
+if hasattr(cv2, "IMREAD_COLOR_RGB"):
+    _JPEG_DECODE_FLAGS["rgb"] = (
+        cv2.IMREAD_COLOR_RGB,
+        tuple(
+            (scale, (flags & ~cv2.IMREAD_COLOR) | cv2.IMREAD_COLOR_RGB)
+            for scale, flags in _REDUCED_COLOR_FLAGS
+        ),
+    )
+
+
+def _read_exact(pipe: io.RawIOBase, view: memoryview) -> bool:
+    """
+    Fill a buffer completely from an unbuffered pipe.
+
+    Args:
+        pipe: Raw (unbuffered) binary file object to read from
+        view: Writable byte view to fill
+
+    Returns:
+        bool: True if the buffer was filled, False on end of file
+    """
+    got = 0
+    total = len(view)
+    while got < total:
+        n = pipe.readinto(view[got:])
+        if not n:
+            return False
+        got += n
+    return True
+
+
+def _cvt_color_umat(src: np.ndarray, code: int) -> np.ndarray:
+    """
+    Run cvtColor through OpenCL: upload to a cv2.UMat, convert, download.
+
+    Args:
+        src: Input frame
+        code: cv2.COLOR_* conversion code
+
+    Returns:
+        np.ndarray: The converted frame
+    """
+    # The OpenCV stubs have no UMat(ndarray) overload and type cvtColor's result
+    # as an ndarray, though a UMat in gives a UMat out
+    return cv2.cvtColor(cv2.UMat(src), code).get()  # type: ignore[call-overload, attr-defined]
+
+
+def _run_capture(cmd: Sequence[str], keep_stdout: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a one-shot rpicam-still capture, collecting its output as bytes.
+
+    An absolute argv[0] and close_fds=False let CPython start the child with
+    posix_spawn instead of forking this (OpenCV/NumPy-sized) process. Descriptors
+    opened by Python are non-inheritable, so the child still doesn't get them.
+
+    Args:
+        cmd: Command and arguments, with the resolved path of the binary first
+        keep_stdout: Capture stdout (the image, with ``-o -``); otherwise it is
+            discarded and only stderr is piped, for the error message
+
+    Returns:
+        subprocess.CompletedProcess: The finished process
+    """
+    stdout = subprocess.PIPE if keep_stdout else subprocess.DEVNULL
+    return subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE, close_fds=False, check=False)
+
+
+def _opencl_faster(code: int, src: np.ndarray, rounds: int = 5) -> bool:
+    """
+    Check whether cvtColor through OpenCL (cv2.UMat) beats the CPU for a frame.
+
+    Only devices with a usable OpenCL driver are tried. The GPU path pays an
+    upload and a download per frame, so on most boards the CPU wins and this
+    returns False after a short warmup.
+
+    Args:
+        code: cv2.COLOR_* conversion code
+        src: Frame-sized input to time the conversion on
+        rounds: Timed conversions per backend
+
+    Returns:
+        bool: True if the OpenCL path was faster
+    """
+    try:
+        if not (cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()):
+            return False
+
+        # The first call builds the OpenCL kernel; keep it out of the timing
+        _cvt_color_umat(src, code)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            _cvt_color_umat(src, code)
+        gpu = time.perf_counter() - start
+
+        dst = cv2.cvtColor(src, code)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            cv2.cvtColor(src, code, dst=dst)
+        cpu = time.perf_counter() - start
+    except cv2.error:
+        return False
+
+    return gpu < cpu
+
+
+def _jpeg_size(data) -> Optional[Tuple[int, int]]:
+    """
+    Read the image size from a JPEG's SOF header without decoding it.
+
+    Args:
+        data: Encoded JPEG bytes
+
+    Returns:
+        Optional[Tuple[int, int]]: (width, height), or None if no SOF header is found
+    """
+    pos = 2  # Skip SOI
+    while pos + 9 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = data[pos + 5] << 8 | data[pos + 6]
+            width = data[pos + 7] << 8 | data[pos + 8]
+            return width, height
+        pos += 2 + (data[pos + 2] << 8 | data[pos + 3])
+    return None
+
+
+class _FrameBatcher:
+    """
+    Stream callback that groups frames into lists for a batch consumer.
+
+    A batch is handed over once it holds batch_size frames, or when a frame
+    arrives batch_timeout seconds after the batch was started. Frames in a
+    pending batch keep their buffers referenced, so the stream thread writes
+    new frames elsewhere instead of overwriting them.
+    """
+
+    def __init__(
+        self,
+        batch_callback: Callable[[List[np.ndarray]], None],
+        batch_size: int,
+        batch_timeout: float,
+        callback: Optional[Callable] = None,
+    ):
+        self.batch_callback = batch_callback
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.callback = callback
+        self.frames: List[np.ndarray] = []
+        self.started = 0.0
+
+    def __call__(self, frame: np.ndarray):
+        if self.callback:
+            self.callback(frame)
+
+        if not self.frames:
+            self.started = time.monotonic()
+        self.frames.append(frame)
+
+        if (
+            len(self.frames) >= self.batch_size
+            or time.monotonic() - self.started >= self.batch_timeout
+        ):
+            self.flush()
+
+    def flush(self):
+        """Hand over the pending frames, if any."""
+        if self.frames:
+            frames, self.frames = self.frames, []
+            self.batch_callback(frames)
+
 
 class CameraError(Exception):
     """Custom exception for Camera-related errors."""
@@ -38,9 +254,19 @@ class Camera:
     - Capture images
     - Check camera configuration
 
-    The class uses rpicam-apps (rpicam-still) for camera operations.
+    The class captures through Picamera2 when it is installed, and through
+    rpicam-apps (rpicam-still) otherwise.
     """
 
+    # OpenCV worker threads while a stream runs. The per-frame decode and color
+    # kernels are too small to gain from OpenCV's pool, which would only preempt
+    # the stream thread; None leaves OpenCV's setting alone
+    STREAM_OPENCV_THREADS: Optional[int] = 1
+
+    # CPUs to pin the stream thread to, e.g. {3} for a core kept free with
+    # isolcpus=3; None leaves it free to run anywhere
+    STREAM_CPU_AFFINITY: Optional[Set[int]] = None
+
     def __init__(
         self,
         resolution: Tuple[int, int] = (640, 480),
@@ -66,12 +292,26 @@ class Camera:
         self.framerate = framerate
         self.rotation = rotation
         self.format = format.lower()
-        self._camera = None
+        self._camera: Optional["cv2.VideoCapture"] = None
+        self._picam2: Optional[Any] = None
         self._is_streaming = False
         self._stream_thread: Optional[threading.Thread] = None
+        self._vid_proc: Optional[subprocess.Popen] = None
+        self._saved_opencv_threads: Optional[int] = None
         self._stop_event = threading.Event()
-        self._frame = None
-        self._frame_lock = threading.Lock()
+        # Latest frame. It is only ever replaced by a single reference store, so
+        # readers take it without a lock
+        self._frame: Optional[np.ndarray] = None
+        # Double buffer the stream thread converts frames into
+        self._frame_bufs: List[Optional[np.ndarray]] = [None, None]
+        # Latest-wins bookkeeping: frames published, the last one a caller read,
+        # and how many were replaced before anyone read them
+        self._frame_seq = 0
+        self._consumed_seq = 0
+        self._drops = 0
+        self._frame_ready = threading.Event()
+        self._fps = 0.0
+        self._last_frame_time: Optional[float] = None
 
         # Supported formats
         self._supported_formats = ["bgr", "rgb", "gray"]
@@ -83,12 +323,27 @@ class Camera:
         # Camera device ID
         self._camera_id = 0
 
-        # Check for rpicam-apps availability
-        if not shutil.which("rpicam-still"):
+        # Check for rpicam-apps availability. The resolved paths are exec'd directly,
+        # so captures don't search PATH on every spawn
+        self._rpicam_still = shutil.which("rpicam-still")
+        if not self._rpicam_still:
             raise CameraError("rpicam-still not found. Please install rpicam-apps package.")
+        self._rpicam_vid = shutil.which("rpicam-vid")
 
         logger.info("Using rpicam-apps for camera operations")
 
+        # rpicam-still arguments shared by every capture, built once
+        self._still_cmd: Tuple[str, ...] = (
+            self._rpicam_still,
+            "-n",  # No preview
+            "--width",
+            str(self.resolution[0]),
+            "--height",
+            str(self.resolution[1]),
+        )
+        if self.rotation != 0:
+            self._still_cmd += ("--rotation", str(self.rotation))
+
         # Check system configuration
         if auto_check_config:
             self.check_system_config()
@@ -111,10 +366,8 @@ class Camera:
         """
         # Check if rpicam-still can list cameras
         try:
-            result = subprocess.run(
-                ["rpicam-still", "--list-cameras"], capture_output=True, text=True, check=False
-            )
-            if "Available cameras" not in result.stdout:
+            _, stdout, _ = _subproc_cache.cached_run(["rpicam-still", "--list-cameras"])
+            if "Available cameras" not in stdout:
                 raise CameraError("No cameras detected by rpicam-still")
         except FileNotFoundError:
             raise CameraError("rpicam-still not found. Please install rpicam-apps package.")
@@ -153,48 +406,175 @@ class Camera:
         return True
 
     def _init_camera(self):
-        """Initialize camera using rpicam CLI tools."""
-        # For OpenCV fallback (not primary capture method but used for setting adjustments)
-        self._camera = cv2.VideoCapture(0)
+        """Initialize camera using Picamera2, or rpicam CLI tools as a fallback."""
+        if PICAMERA2_AVAILABLE and self._init_picamera2():
+            return
 
         # Test camera using rpicam-still
         try:
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=True) as temp_file:
-                cmd = [
-                    "rpicam-still",
-                    "-n",  # No preview
-                    "-t",
-                    "1",  # Timeout 1ms
-                    "-o",
-                    temp_file.name,  # Output file
-                    "--width",
-                    str(self.resolution[0]),
-                    "--height",
-                    str(self.resolution[1]),
-                ]
-
-                # Add rotation if specified
-                if self.rotation != 0:
-                    cmd.extend(["--rotation", str(self.rotation)])
-
-                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            # No output file: the capture only has to succeed, so nothing is encoded
+            cmd = self._still_cmd + (
+                "-t",
+                "1",  # Timeout 1ms
+            )
 
-                if result.returncode != 0:
-                    raise CameraError(
-                        f"Failed to initialize camera with rpicam-still: {result.stderr}"
-                    )
+            result = _run_capture(cmd, keep_stdout=False)
 
-                logger.info("Camera initialized using rpicam-still")
+            if result.returncode != 0:
+                raise CameraError(
+                    "Failed to initialize camera with rpicam-still: "
+                    f"{result.stderr.decode('utf-8', 'replace')}"
+                )
+
+            logger.info("Camera initialized using rpicam-still")
 
         except Exception as e:
             raise CameraError(f"Failed to initialize camera: {str(e)}")
 
-    def start_stream(self, callback: Optional[Callable] = None):
+    def _init_picamera2(self) -> bool:
+        """
+        Open and start the camera through Picamera2.
+
+        Frames are then captured straight from the libcamera buffers, with no
+        rpicam-still process or JPEG encode/decode per frame. Rotation is applied
+        by the ISP through the configuration transform.
+
+        Returns:
+            bool: True if Picamera2 is running, False to fall back to rpicam-still
+        """
+        picam2 = None
+        try:
+            picam2 = Picamera2()
+            config = picam2.create_video_configuration(
+                main={"size": tuple(self.resolution), "format": _PICAMERA2_FORMATS[self.format]},
+                controls={"FrameRate": self.framerate},
+                transform=Transform(rotation=self.rotation),
+            )
+            picam2.configure(config)
+            picam2.start()
+        except Exception as e:
+            logger.warning(f"Picamera2 unavailable, falling back to rpicam-still: {str(e)}")
+            if picam2 is not None:
+                try:
+                    picam2.close()
+                except Exception:
+                    pass
+            return False
+
+        self._picam2 = picam2
+        logger.info("Camera initialized using Picamera2")
+        return True
+
+    def _capture_picamera2(self) -> np.ndarray:
+        """
+        Capture the next frame from Picamera2 in the configured format.
+
+        Returns:
+            np.ndarray: The captured frame
+        """
+        assert self._picam2 is not None  # Only called once Picamera2 is initialized
+        frame = self._picam2.capture_array("main")
+        if self.format == "gray":
+            # The Y plane is the grayscale image; the chroma rows below it are dropped
+            width, height = self.resolution
+            frame = frame[:height, :width]
+        return frame
+
+    def _decode_jpeg(
+        self, data: Union[bytes, memoryview], reuse_buffer: bool = False
+    ) -> Optional[np.ndarray]:
+        """
+        Decode a JPEG from memory and convert it to the configured format.
+
+        A JPEG larger than the configured resolution is decoded at 1/2, 1/4 or
+        1/8 scale by libjpeg's scaled IDCT, and only resized the rest of the way
+        to the configured resolution if needed.
+
+        Args:
+            data: Encoded JPEG bytes, e.g. rpicam-still stdout or a view into the
+                stream buffer
+            reuse_buffer: Convert into the stream double buffer instead of a new
+                array (stream thread only)
+
+        Returns:
+            Optional[np.ndarray]: The decoded frame, or None if it can't be decoded
+        """
+        if not data:
+            return None
+
+        # Gray is decoded from the JPEG's luma alone and RGB straight to RGB, so
+        # no color conversion follows when OpenCV supports it
+        convert_rgb = self.format not in _JPEG_DECODE_FLAGS
+        flags, reduced = _JPEG_DECODE_FLAGS[self.format if not convert_rgb else "bgr"]
+        target_w, target_h = self.resolution
+        # A JPEG whose header can't be parsed is decoded at full size
+        src_w, src_h = _jpeg_size(data) or (0, 0)
+        oversized = src_w > target_w and src_h > target_h
+        if oversized:
+            ratio = min(src_w // target_w, src_h // target_h)
+            for scale, reduced_flags in reduced:
+                if ratio >= scale:
+                    flags = reduced_flags
+                    break
+
+        frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+        if frame is None:
+            return None
+
+        if oversized and frame.shape[:2] != (target_h, target_w):
+            frame = cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_AREA)
+
+        # Apply format conversion if needed
+        if convert_rgb:
+            dst = self._spare_frame_buffer(frame.shape) if reuse_buffer else None
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+
+        return frame
+
+    def _spare_frame_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Get the half of the double buffer that isn't the published frame.
+
+        The buffer is replaced with a fresh one if it has the wrong shape or a
+        caller still holds a frame from it, so a frame returned by get_frame()
+        never changes under the caller.
+
+        Args:
+            shape: Shape of the frame about to be written
+
+        Returns:
+            np.ndarray: A uint8 buffer of the given shape that is safe to overwrite
+        """
+        i = 1 if self._frame is self._frame_bufs[0] else 0
+        buf = self._frame_bufs[i]
+        # Expected references: the list, `buf` and getrefcount()'s argument
+        if buf is None or buf.shape != shape or sys.getrefcount(buf) > 3:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._frame_bufs[i] = buf
+        return buf
+
+    def start_stream(
+        self,
+        callback: Optional[Callable] = None,
+        batch_size: int = 1,
+        batch_timeout_ms: int = 100,
+        batch_callback: Optional[Callable[[List[np.ndarray]], None]] = None,
+    ):
         """
         Start streaming video from the camera.
 
+        Frames come from Picamera2 when it is in use. Otherwise one long-running
+        rpicam-vid process streams raw YUV420 (or MJPEG, for widths the ISP pads)
+        over a pipe, and rpicam-still is spawned per frame only if rpicam-vid
+        isn't installed.
+
         Args:
             callback: Optional callback function that will be called with each new frame
+            batch_size: Number of frames per batch_callback call
+            batch_timeout_ms: Hand over a partial batch once its first frame is this old
+            batch_callback: Optional callback called with lists of frames, for consumers
+                that amortize per-call work (e.g. one inference over a batch). Pending
+                frames are flushed when the stream stops.
 
         Raises:
             CameraError: If streaming cannot be started
@@ -202,69 +582,307 @@ class Camera:
         if self._is_streaming:
             return
 
+        if batch_size < 1:
+            raise CameraError(f"batch_size must be at least 1, got {batch_size}")
+
+        sink = callback
+        if batch_callback is not None:
+            sink = _FrameBatcher(batch_callback, batch_size, batch_timeout_ms / 1000.0, callback)
+
         self._stop_event.clear()
+        self._fps = 0.0
+        self._last_frame_time = None
+
+        if self._picam2 is not None:
+            target = self._stream_picamera2
+        elif self._rpicam_vid:
+            if self._packed_yuv420():
+                self._vid_proc = self._start_rpicam_vid("yuv420")
+                target = self._stream_yuv
+            else:
+                self._vid_proc = self._start_rpicam_vid("mjpeg")
+                target = self._stream_mjpeg
+        else:
+            target = self._stream_stills
+
+        if Camera.STREAM_OPENCV_THREADS is not None:
+            self._saved_opencv_threads = cv2.getNumThreads()
+            cv2.setNumThreads(Camera.STREAM_OPENCV_THREADS)
+
         self._is_streaming = True
+        self._stream_thread = threading.Thread(target=self._run_stream, args=(target, sink))
+        self._stream_thread.daemon = True
+        self._stream_thread.start()
+        logger.info("Camera streaming started")
 
-        # Use rpicam-still streaming
-        def stream_thread_func():
-            while not self._stop_event.is_set():
-                try:
-                    # Capture using rpicam-still
-                    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=True) as temp_file:
-                        cmd = [
-                            "rpicam-still",
-                            "-n",  # No preview
-                            "-t",
-                            "1",  # Timeout 1ms
-                            "--immediate",  # Capture immediately
-                            "-o",
-                            temp_file.name,  # Output file
-                            "--width",
-                            str(self.resolution[0]),
-                            "--height",
-                            str(self.resolution[1]),
-                        ]
-
-                        # Add rotation if specified
-                        if self.rotation != 0:
-                            cmd.extend(["--rotation", str(self.rotation)])
-
-                        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-                        if result.returncode != 0:
-                            logger.warning(f"Failed to capture frame: {result.stderr}")
-                            continue
-
-                        # Read the image with OpenCV
-                        frame = cv2.imread(temp_file.name)
-
-                        if frame is None:
-                            continue
-
-                        # Apply format conversion if needed
-                        if self.format == "rgb":
-                            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        elif self.format == "gray":
-                            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-                        # Update the current frame with thread safety
-                        with self._frame_lock:
-                            self._frame = frame
-
-                        # Call the callback if provided
-                        if callback:
-                            callback(frame)
+    def _run_stream(self, target: Callable, sink: Optional[Callable]):
+        """Run a stream thread body, then flush any partial batch."""
+        if Camera.STREAM_CPU_AFFINITY:
+            try:
+                # On Linux, pid 0 applies to the calling thread only
+                os.sched_setaffinity(0, Camera.STREAM_CPU_AFFINITY)
+            except (AttributeError, OSError) as e:
+                logger.warning(f"Could not pin stream thread to CPUs: {str(e)}")
 
+        try:
+            target(sink)
+        finally:
+            if isinstance(sink, _FrameBatcher):
+                try:
+                    sink.flush()
                 except Exception as e:
                     logger.error(f"Stream error: {str(e)}")
 
-                # Limit CPU usage - adjust sleep time based on framerate
-                time.sleep(1.0 / self.framerate)
+    def _packed_yuv420(self) -> bool:
+        """
+        Check whether rpicam-apps YUV420 output is tightly packed at this resolution.
 
-        self._stream_thread = threading.Thread(target=stream_thread_func)
-        self._stream_thread.daemon = True
-        self._stream_thread.start()
-        logger.info("Camera streaming started")
+        Rows are only unpadded when the width is a multiple of the ISP's 64-byte
+        line alignment, and the half-height chroma planes need an even height.
+
+        Returns:
+            bool: True if raw YUV420 frames can be read as width * height * 3 / 2 bytes
+        """
+        width, height = self.resolution
+        return width % 64 == 0 and height % 2 == 0
+
+    def _start_rpicam_vid(self, codec: str) -> subprocess.Popen:
+        """
+        Launch rpicam-vid streaming to a pipe until it is terminated.
+
+        Args:
+            codec: rpicam-vid output codec, "yuv420" or "mjpeg"
+
+        Returns:
+            subprocess.Popen: The rpicam-vid process, with stdout as the frame pipe
+
+        Raises:
+            CameraError: If rpicam-vid can't be started
+        """
+        if self._rpicam_vid is None:
+            raise CameraError("rpicam-vid not found. Please install rpicam-apps package.")
+
+        cmd = [
+            self._rpicam_vid,
+            "-n",  # No preview
+            "-t",
+            "0",  # Run until stopped
+            "--codec",
+            codec,
+            "--flush",  # Push every frame into the pipe as soon as it is encoded
+            "-o",
+            "-",  # Write the stream to stdout
+            "--width",
+            str(self.resolution[0]),
+            "--height",
+            str(self.resolution[1]),
+            "--framerate",
+            str(self.framerate),
+        ]
+
+        # Rotation is set once for the whole stream
+        if self.rotation != 0:
+            cmd.extend(["--rotation", str(self.rotation)])
+
+        try:
+            return subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0
+            )
+        except OSError as e:
+            raise CameraError(f"Failed to start rpicam-vid: {str(e)}")
+
+    def _publish_frame(self, frame: np.ndarray, callback: Optional[Callable]):
+        """Make a captured frame the latest one and hand it to the stream callback."""
+        # A single reference store publishes the frame to get_frame()
+        self._frame = frame
+
+        # Once a caller reads frames, count the ones it never saw
+        if self._consumed_seq and self._consumed_seq < self._frame_seq:
+            self._drops += 1
+        self._frame_seq += 1
+        self._frame_ready.set()
+
+        now = time.monotonic()
+        if self._last_frame_time is not None and now > self._last_frame_time:
+            rate = 1.0 / (now - self._last_frame_time)
+            self._fps = rate if self._fps == 0.0 else 0.9 * self._fps + 0.1 * rate
+        self._last_frame_time = now
+
+        # Call the callback if provided
+        if callback:
+            callback(frame)
+
+    def _stream_picamera2(self, callback: Optional[Callable]):
+        """Stream thread body for Picamera2 capture."""
+        while not self._stop_event.is_set():
+            # capture_array() blocks until the next frame, which paces the loop
+            try:
+                self._publish_frame(self._capture_picamera2(), callback)
+            except Exception as e:
+                logger.error(f"Stream error: {str(e)}")
+                self._stop_event.wait(1.0 / self.framerate)
+
+    def _stream_mjpeg(self, callback: Optional[Callable]):
+        """
+        Stream thread body for the rpicam-vid MJPEG pipe.
+
+        JPEG frames are split on their SOI (FF D8) and EOI (FF D9) markers; entropy
+        coded data stuffs every FF byte, so EOI can't appear inside a frame. When a
+        read brings in several complete frames only the newest one is decoded.
+        """
+        proc = self._vid_proc
+        # Set by start_stream() before the thread starts, with stdout piped
+        assert proc is not None and proc.stdout is not None
+        fd = proc.stdout.fileno()
+        buf = bytearray()
+        scan = 0  # Where to resume looking for EOI in buf
+
+        while not self._stop_event.is_set():
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError as e:
+                logger.error(f"Stream error: {str(e)}")
+                break
+            if not chunk:
+                break
+            buf += chunk
+
+            # Find the end of the last complete frame in the buffer
+            end = -1
+            while True:
+                eoi = buf.find(b"\xff\xd9", scan)
+                if eoi < 0:
+                    # Keep the last byte in case it is the first half of a marker
+                    scan = max(len(buf) - 1, 0)
+                    break
+                end = eoi + 2
+                scan = end
+            if end < 0:
+                continue
+
+            start = buf.rfind(b"\xff\xd8", 0, end)
+            try:
+                if start >= 0:
+                    with memoryview(buf) as view:
+                        frame = self._decode_jpeg(view[start:end], reuse_buffer=True)
+                    if frame is not None:
+                        self._publish_frame(frame, callback)
+            except Exception as e:
+                logger.error(f"Stream error: {str(e)}")
+
+            del buf[:end]
+            scan -= end
+
+        self._fall_back_to_stills(proc, callback)
+
+    def _stream_yuv(self, callback: Optional[Callable]):
+        """
+        Stream thread body for the rpicam-vid raw YUV420 pipe.
+
+        Every frame is exactly width * height * 3 / 2 bytes: the Y plane followed
+        by the quarter-size U and V planes. Color frames are converted with a
+        single cvtColor, offloaded to OpenCL when a warmup shows it is faster on
+        this device; for gray the Y plane is read straight into the frame buffer
+        and the chroma planes are discarded.
+        """
+        proc = self._vid_proc
+        # Started with bufsize=0, so stdout is the raw pipe
+        assert proc is not None and isinstance(proc.stdout, io.RawIOBase)
+        pipe = proc.stdout
+        width, height = self.resolution
+        luma_bytes = width * height
+
+        raw = bytearray(luma_bytes * 3 // 2)
+        raw_view = memoryview(raw)
+        yuv = np.frombuffer(raw, dtype=np.uint8).reshape(height * 3 // 2, width)
+        code = cv2.COLOR_YUV2RGB_I420 if self.format == "rgb" else cv2.COLOR_YUV2BGR_I420
+        use_umat = self.format != "gray" and _opencl_faster(code, yuv)
+        if use_umat:
+            logger.info("Converting stream frames with OpenCL")
+
+        while not self._stop_event.is_set():
+            try:
+                if self.format == "gray":
+                    frame = self._spare_frame_buffer((height, width))
+                    if not _read_exact(pipe, frame.data.cast("B")):
+                        break
+                    if not _read_exact(pipe, raw_view[luma_bytes:]):
+                        break
+                else:
+                    if not _read_exact(pipe, raw_view):
+                        break
+                    if use_umat:
+                        frame = _cvt_color_umat(yuv, code)
+                    else:
+                        dst = self._spare_frame_buffer((height, width, 3))
+                        frame = cv2.cvtColor(yuv, code, dst=dst)
+
+                self._publish_frame(frame, callback)
+            except OSError as e:
+                logger.error(f"Stream error: {str(e)}")
+                break
+            except Exception as e:
+                logger.error(f"Stream error: {str(e)}")
+
+        self._fall_back_to_stills(proc, callback)
+
+    def _fall_back_to_stills(self, proc: subprocess.Popen, callback: Optional[Callable]):
+        """Keep streaming with rpicam-still if rpicam-vid ended before stop_stream()."""
+        if self._stop_event.is_set():
+            return
+
+        try:
+            code = proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            code = None
+        logger.warning(
+            f"rpicam-vid stopped unexpectedly (exit code {code}), "
+            "falling back to rpicam-still capture"
+        )
+        self._stream_stills(callback)
+
+    def _stream_stills(self, callback: Optional[Callable]):
+        """Stream thread body spawning rpicam-still for every frame."""
+        cmd = self._still_cmd + (
+            "-t",
+            "1",  # Timeout 1ms
+            "--immediate",  # Capture immediately
+            "-o",
+            "-",  # Write the JPEG to stdout
+        )
+
+        # Frames are scheduled on fixed deadlines, so capture time comes out of
+        # the frame interval instead of being added to it
+        interval = 1.0 / self.framerate
+        next_frame = time.monotonic()
+
+        while not self._stop_event.is_set():
+            try:
+                # Capture using rpicam-still
+                result = _run_capture(cmd)
+
+                if result.returncode != 0:
+                    logger.warning(
+                        f"Failed to capture frame: {result.stderr.decode('utf-8', 'replace')}"
+                    )
+                else:
+                    # Decode the image with OpenCV
+                    frame = self._decode_jpeg(result.stdout, reuse_buffer=True)
+
+                    if frame is not None:
+                        self._publish_frame(frame, callback)
+
+            except Exception as e:
+                logger.error(f"Stream error: {str(e)}")
+
+            # Wait out the rest of the interval; stop_stream() wakes the wait early
+            next_frame += interval
+            slack = next_frame - time.monotonic()
+            if slack > 0:
+                self._stop_event.wait(slack)
+            else:
+                # Running behind: start the schedule again rather than bursting
+                next_frame = time.monotonic()
 
     def stop_stream(self):
         """Stop the camera stream."""
@@ -272,77 +890,165 @@ class Camera:
             return
 
         self._stop_event.set()
+
+        # Ending rpicam-vid closes the pipe, which wakes the reader thread
+        proc = self._vid_proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
         if self._stream_thread:
             self._stream_thread.join(timeout=1.0)
 
+        if proc is not None:
+            try:
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            self._vid_proc = None
+
+        if self._saved_opencv_threads is not None:
+            cv2.setNumThreads(self._saved_opencv_threads)
+            self._saved_opencv_threads = None
+
         self._is_streaming = False
         logger.info("Camera streaming stopped")
 
-    def get_frame(self) -> np.ndarray:
+    def get_frame(self, copy: bool = False) -> np.ndarray:
         """
         Get the latest frame from the camera.
 
+        While streaming, the latest frame is returned as a read-only view
+        without copying it; pass copy=True to get a writable copy.
+
+        Args:
+            copy: Return a writable copy of the streamed frame
+
         Returns:
             np.ndarray: The latest camera frame
 
         Raises:
             CameraError: If no frame is available
         """
+        frame: Optional[np.ndarray]
+
         # For direct capture without streaming
+        if not self._is_streaming and self._picam2 is not None:
+            try:
+                frame = self._capture_picamera2()
+            except Exception as e:
+                raise CameraError(f"Failed to capture frame: {str(e)}")
+
+            self._frame = frame
+
+            return frame
+
         if not self._is_streaming:
             # Capture a frame directly using rpicam-still
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=True) as temp_file:
-                cmd = [
-                    "rpicam-still",
-                    "-n",  # No preview
-                    "-t",
-                    "500",  # Timeout 500ms
-                    "--immediate",  # Capture immediately
-                    "-o",
-                    temp_file.name,  # Output file
-                    "--width",
-                    str(self.resolution[0]),
-                    "--height",
-                    str(self.resolution[1]),
-                ]
-
-                # Add rotation if specified
-                if self.rotation != 0:
-                    cmd.extend(["--rotation", str(self.rotation)])
-
-                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            cmd = self._still_cmd + (
+                "-t",
+                "500",  # Timeout 500ms
+                "--immediate",  # Capture immediately
+                "-o",
+                "-",  # Write the JPEG to stdout
+            )
 
-                if result.returncode != 0:
-                    raise CameraError(f"Failed to capture frame: {result.stderr}")
+            # For gray, take raw YUV420 and keep the Y plane: no JPEG and no conversion
+            raw_gray = self.format == "gray" and self._packed_yuv420()
+            if raw_gray:
+                cmd += ("--encoding", "yuv420")
 
-                # Read the image with OpenCV
-                frame = cv2.imread(temp_file.name)
+            result = _run_capture(cmd)
 
-                if frame is None:
+            if result.returncode != 0:
+                raise CameraError(
+                    f"Failed to capture frame: {result.stderr.decode('utf-8', 'replace')}"
+                )
+
+            if raw_gray:
+                width, height = self.resolution
+                if len(result.stdout) < width * height:
                     raise CameraError("Failed to read captured image")
+                luma = np.frombuffer(result.stdout, dtype=np.uint8, count=width * height)
+                frame = luma.reshape(height, width).copy()
+            else:
+                # Decode the image with OpenCV
+                frame = self._decode_jpeg(result.stdout)
 
-                # Apply format conversion if needed
-                if self.format == "rgb":
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                elif self.format == "gray":
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if frame is None:
+                raise CameraError("Failed to read captured image")
 
-                # Update the current frame with thread safety
-                with self._frame_lock:
-                    self._frame = frame
+            # Update the current frame
+            self._frame = frame
 
-                return frame
+            return frame
 
         # Get the latest frame from the stream
-        with self._frame_lock:
-            if self._frame is None:
-                raise CameraError("No frame available")
-            return self._frame.copy()
+        frame = self._take_frame(copy)
+        if frame is None:
+            raise CameraError("No frame available")
+        return frame
+
+    def try_get_frame(self, timeout: float = 0, copy: bool = False) -> Optional[np.ndarray]:
+        """
+        Get a frame from the stream that hasn't been read yet, without capturing.
+
+        Unlike get_frame(), this never spawns a capture: it returns the latest
+        streamed frame if it is new, or waits up to timeout seconds for one.
+
+        Args:
+            timeout: Seconds to wait for a new frame; 0 returns immediately
+            copy: Return a writable copy instead of a read-only view
+
+        Returns:
+            Optional[np.ndarray]: The new frame, or None if the stream isn't running
+            or no new frame arrived in time
+        """
+        if not self._is_streaming:
+            return None
+
+        if self._frame_seq == self._consumed_seq:
+            # Clear before re-checking so a frame published in between still wakes us
+            self._frame_ready.clear()
+            if self._frame_seq == self._consumed_seq and not self._frame_ready.wait(timeout):
+                return None
+
+        return self._take_frame(copy)
+
+    def _take_frame(self, copy: bool) -> Optional[np.ndarray]:
+        """Read the latest streamed frame and mark it consumed."""
+        seq = self._frame_seq
+        frame = self._frame
+        if frame is None:
+            return None
+        self._consumed_seq = max(seq, 1)
+
+        if copy:
+            return frame.copy()
+
+        view = frame.view()
+        view.flags.writeable = False
+        return view
+
+    def get_stream_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get streaming health counters.
+
+        Returns:
+            Dict[str, Union[int, float]]: ``frames`` published, ``drops`` (frames
+            replaced before get_frame()/try_get_frame() read them, counted once a
+            caller starts reading) and ``fps`` (smoothed stream frame rate)
+        """
+        return {"frames": self._frame_seq, "drops": self._drops, "fps": round(self._fps, 2)}
 
     def capture_image(self, filepath: Optional[str] = None) -> np.ndarray:
         """
         Capture a still image from the camera.
 
+        While a stream is running, or with Picamera2, the image is taken at the
+        stream resolution, since the camera can't be opened a second time.
+
         Args:
             filepath: Optional path to save the image
 
@@ -352,47 +1058,75 @@ class Camera:
         Raises:
             CameraError: If image cannot be captured
         """
+        frame: Optional[np.ndarray]
+
+        # Picamera2 and a running rpicam stream hold the camera open, so stills are
+        # taken from them and saved by OpenCV
+        if filepath and (self._picam2 is not None or self._is_streaming):
+            if self._picam2 is None:
+                frame = self.get_frame()
+            else:
+                try:
+                    frame = self._capture_picamera2()
+                except Exception as e:
+                    raise CameraError(f"Failed to capture image: {str(e)}")
+            to_save = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR) if self.format == "rgb" else frame
+            if not cv2.imwrite(filepath, to_save):
+                raise CameraError(f"Failed to save captured image to {filepath}")
+            return frame
+
         # If filepath is provided, capture directly to that file using rpicam-still
         if filepath:
-            cmd = [
-                "rpicam-still",
-                "-n",  # No preview
+            cmd = self._still_cmd + (
                 "-t",
                 "1000",  # Timeout 1000ms
                 "-o",
                 filepath,  # Output file
-                "--width",
-                str(self.resolution[0]),
-                "--height",
-                str(self.resolution[1]),
-            ]
-
-            # Add rotation if specified
-            if self.rotation != 0:
-                cmd.extend(["--rotation", str(self.rotation)])
+            )
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            result = _run_capture(cmd, keep_stdout=False)
 
             if result.returncode != 0:
-                raise CameraError(f"Failed to capture image: {result.stderr}")
+                raise CameraError(
+                    f"Failed to capture image: {result.stderr.decode('utf-8', 'replace')}"
+                )
 
-            # Read the image with OpenCV
-            frame = cv2.imread(filepath)
+            # Read the image with OpenCV, straight into the output format
+            convert_rgb = self.format not in _JPEG_DECODE_FLAGS
+            flags = _JPEG_DECODE_FLAGS[self.format if not convert_rgb else "bgr"][0]
+            frame = cv2.imread(filepath, flags)
 
             if frame is None:
                 raise CameraError(f"Failed to read captured image from {filepath}")
 
             # Apply format conversion if needed
-            if self.format == "rgb":
+            if convert_rgb:
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            elif self.format == "gray":
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
             return frame
         else:
             # If no filepath is provided, use get_frame
             return self.get_frame()
 
+    def _settings_capture(self) -> "cv2.VideoCapture":
+        """
+        Get the OpenCV capture used for setting adjustments, opening it on first use.
+
+        Opening V4L2 is slow and holds /dev/video0, so it is only done for callers
+        that actually use the settings API.
+
+        Returns:
+            cv2.VideoCapture: The opened capture device
+
+        Raises:
+            CameraError: If the device can't be opened
+        """
+        if self._camera is None:
+            self._camera = cv2.VideoCapture(self._camera_id)
+        if not self._camera.isOpened():
+            raise CameraError("Camera is not initialized")
+        return self._camera
+
     def adjust_setting(self, setting: str, value: Union[int, float, bool]) -> bool:
         """
         Adjust a camera setting.
@@ -411,8 +1145,7 @@ class Camera:
         Raises:
             CameraError: If setting cannot be adjusted
         """
-        if not self._camera or not self._camera.isOpened():
-            raise CameraError("Camera is not initialized")
+        camera = self._settings_capture()
 
         setting_mapping = {
             "brightness": cv2.CAP_PROP_BRIGHTNESS,
@@ -433,7 +1166,7 @@ class Camera:
             raise CameraError(f"Unknown setting: {setting}")
 
         prop_id = setting_mapping[setting.lower()]
-        success = self._camera.set(prop_id, value)
+        success = camera.set(prop_id, value)
 
         if not success:
             logger.warning(f"Setting {setting} may not have effect with rpicam-still capture")
@@ -456,8 +1189,7 @@ class Camera:
         Raises:
             CameraError: If setting cannot be retrieved
         """
-        if not self._camera or not self._camera.isOpened():
-            raise CameraError("Camera is not initialized")
+        camera = self._settings_capture()
 
         setting_mapping = {
             "brightness": cv2.CAP_PROP_BRIGHTNESS,
@@ -478,7 +1210,7 @@ class Camera:
             raise CameraError(f"Unknown setting: {setting}")
 
         prop_id = setting_mapping[setting.lower()]
-        value = self._camera.get(prop_id)
+        value = camera.get(prop_id)
 
         return value
 
@@ -511,8 +1243,16 @@ class Camera:
         if self._is_streaming:
             self.stop_stream()
 
-        if self._camera and self._camera.isOpened():
+        if self._camera is not None:
             self._camera.release()
             self._camera = None
 
+        if self._picam2 is not None:
+            try:
+                self._picam2.stop()
+                self._picam2.close()
+            except Exception as e:
+                logger.warning(f"Error closing Picamera2: {str(e)}")
+            self._picam2 = None
+
         logger.info("Camera closed")
@@ -1,6 +1,6 @@
 from .composer import EinkComposer
 from .dithering import floyd_steinberg_dither, threshold_dither
-from .image_ops import resize_image, flip_horizontal, rotate_ccw_90, invert_colors
+from .image_ops import resize_image, flip_horizontal, rotate_ccw_90, invert_colors, pack_1bpp
 from .template_renderer import TemplateRenderer, create_template_from_dict
 
 from distiller_sdk import __version__
@@ -15,5 +15,6 @@ __all__ = [
     "flip_horizontal",
     "rotate_ccw_90",
     "invert_colors",
+    "pack_1bpp",
     "__version__",
 ]
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+EinkComposer CLI unit tests.
+
+These run without hardware; the session file is redirected to a temporary home
+directory.
+
+    python -m distiller_sdk.hardware.eink.composer._cli_test
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from distiller_sdk.hardware.eink import DisplayError, DisplayMode
+from distiller_sdk.hardware.eink.composer import EinkComposer
+from distiller_sdk.hardware.eink.composer.cli import (
+    ComposerSession,
+    _parse_args,
+    _run_batch,
+    _run_command,
+)
+
+
+class TestBatch(unittest.TestCase):
+    """Test cases for the batch subcommand."""
+
+    def setUp(self):
+        """Set up a temporary home directory holding the session file."""
+        self.home = tempfile.TemporaryDirectory()
+        self.home_patch = patch.object(Path, "home", return_value=Path(self.home.name))
+        self.home_patch.start()
+        self.session_file = Path(self.home.name) / ".eink_composer_session.json"
+
+    def tearDown(self):
+        """Clean up the temporary home directory."""
+        self.home_patch.stop()
+        self.home.cleanup()
+
+    def _run_batch(self, commands: str):
+        """Run batch commands against a fresh lazily-loaded session."""
+        batch_file = os.path.join(self.home.name, "commands.txt")
+        with open(batch_file, "w") as f:
+            f.write(commands)
+
+        with redirect_stdout(io.StringIO()):
+            _run_batch(batch_file, ComposerSession(lazy=True))
+
+        with open(self.session_file) as f:
+            return json.load(f)
+
+    def _save_old_session(self):
+        """Save a 100x50 session holding a single text layer 'old'."""
+        session = ComposerSession(lazy=True)
+        session.composer = EinkComposer(100, 50)
+        session.composer.add_text_layer("old", "OLD")
+        session.save_session()
+
+    def test_create_then_add(self):
+        """Layers added after create go into the new composition, not the saved one."""
+        self._save_old_session()
+
+        data = self._run_batch("create --size 250x128\nadd-text new NEW\nlist\n")
+
+        self.assertEqual((data["width"], data["height"]), (250, 128))
+        self.assertEqual([layer["id"] for layer in data["layers"]], ["new"])
+
+    def test_add_to_saved_session(self):
+        """Without create, commands build on the saved composition."""
+        self._save_old_session()
+
+        data = self._run_batch("add-text new NEW\n")
+
+        self.assertEqual((data["width"], data["height"]), (100, 50))
+        self.assertEqual([layer["id"] for layer in data["layers"]], ["old", "new"])
+
+    def test_unknown_layer_type_dropped(self):
+        """Saved layers of an unknown type are not carried into the next save."""
+        self._save_old_session()
+        with open(self.session_file) as f:
+            data = json.load(f)
+        data["layers"].append({"type": "hologram", "id": "ghost", "x": 0, "y": 0})
+        with open(self.session_file, "w") as f:
+            json.dump(data, f)
+
+        data = self._run_batch("add-text new NEW\n")
+
+        self.assertEqual([layer["id"] for layer in data["layers"]], ["old", "new"])
+
+    def test_saved_layer_keys_normalized(self):
+        """Saved layers missing optional keys or carrying extra ones load and save cleanly."""
+        with open(self.session_file, "w") as f:
+            json.dump(
+                {
+                    "width": 100,
+                    "height": 50,
+                    "layers": [{"type": "text", "id": "t", "x": 1, "y": 2, "extra": 1}],
+                },
+                f,
+            )
+
+        data = self._run_batch("list\ntoggle t\n")
+
+        (layer,) = data["layers"]
+        self.assertFalse(layer["visible"])
+        self.assertEqual(layer["text"], "")
+        self.assertNotIn("extra", layer)
+
+
+class TestDisplayCommand(unittest.TestCase):
+    """Test cases for the display subcommand, against a fake 128x250 panel."""
+
+    def setUp(self):
+        """Set up a fake display SDK and a 250x128 landscape session."""
+        self.display = MagicMock()
+        self.display.get_dimensions.return_value = (128, 250)
+        hardware = (MagicMock(return_value=self.display), DisplayMode, DisplayError)
+        self.hardware_patch = patch(
+            "distiller_sdk.hardware.eink.composer.cli._load_hardware", return_value=hardware
+        )
+        self.hardware_patch.start()
+
+        self.session = ComposerSession(lazy=True)
+        self.session.composer = EinkComposer(250, 128)
+
+    def tearDown(self):
+        """Remove the fake display SDK."""
+        self.hardware_patch.stop()
+
+    def _display(self, *options: str):
+        """Run the display command with the given options."""
+        _, args = _parse_args(["display", *options])
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            _run_command(args, self.session)
+
+    def test_rotated_frame_displayed(self):
+        """A landscape composition fits the portrait panel once rotated."""
+        self._display("--rotate")
+
+        self.display.display_image.assert_called_once()
+
+    def test_wrong_size_rejected(self):
+        """A frame that doesn't match the panel is not sent to it."""
+        with self.assertRaises(SystemExit):
+            self._display()
+
+        self.display.display_image.assert_not_called()
+
+
+def run_cli_tests():
+    """Main function to run CLI tests."""
+    unittest.main(verbosity=2)
+
+
+if __name__ == "__main__":
+    run_cli_tests()
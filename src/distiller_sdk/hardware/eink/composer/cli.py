@@ -1,91 +1,69 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import sys
 import json
-import os
+import shlex
 from pathlib import Path
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
-from .composer import EinkComposer
+from .composer import EinkComposer, layer_info
 
-# Try to import hardware display support
-if TYPE_CHECKING:
-    from distiller_sdk.hardware.eink import Display, DisplayMode, ScalingMethod, DitheringMethod
-else:
-    try:
-        sys.path.insert(0, "/opt/distiller-sdk/src")
-        from distiller_sdk.hardware.eink import Display, DisplayMode, ScalingMethod, DitheringMethod
+# orjson is an optional speedup for the session round trip on every command
+try:
+    import orjson
 
-        HARDWARE_AVAILABLE = True
-    except ImportError:
-        HARDWARE_AVAILABLE = False
-        Display = None  # type: ignore
-        DisplayMode = None  # type: ignore
-        ScalingMethod = None  # type: ignore
-        DitheringMethod = None  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
-def create_parser():
-    """Create command line argument parser."""
-    parser = argparse.ArgumentParser(
-        description="E-ink display image composer - Create layered templates for e-ink displays",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # IMPORTANT: Always create a composition first!
-  # Standard e-ink display: EPD128x250 (physically mounted as 250×128 landscape)
-  # Note: Create images in 250×128 landscape, use rotate=90 when displaying
+@functools.lru_cache(maxsize=1)
+def _load_hardware():
+    """
+    Import the e-ink hardware SDK the first time a command needs it.
 
-  # Working example for EPD128x250 hardware:
-  eink-compose create --size 250x128
-  eink-compose add-text hello "HELLO E-INK" --x 50 --y 60
-  eink-compose add-rect border --width 250 --height 128 --filled false
-  eink-compose display --rotate
+    Only the display and hardware commands use it; the other commands leave
+    sys.path alone and don't depend on the SDK being importable.
 
-  # More detailed example:
-  eink-compose create --size 250x128
-  eink-compose add-rect bg --width 250 --height 128 --filled true --color 255
-  eink-compose add-text title "E-INK DISPLAY" --x 70 --y 40
-  eink-compose add-text info "250 x 128 px" --x 85 --y 60
-  eink-compose add-rect frame --x 50 --y 20 --width 150 --height 88 --filled false
-  eink-compose display --rotate --save-preview preview.png
+    Returns:
+        Tuple of (Display, DisplayMode, DisplayError), or None if the SDK can't be
+        imported
+    """
+    try:
+        sys.path.insert(0, "/opt/distiller-sdk/src")
+        from distiller_sdk.hardware.eink import Display, DisplayError, DisplayMode
+    except ImportError:
+        return None
+    return Display, DisplayMode, DisplayError
 
-  # Render to file
-  eink-compose render --output display.png --format png
-  eink-compose render --output display.bin --format binary --dither floyd-steinberg
 
-  # Display options
-  eink-compose display                    # Full refresh
-  eink-compose display --partial          # Fast refresh (may ghost)
-  eink-compose display --rotate --flip-h  # With transformations
+def _read_json(path) -> Any:
+    """Read and parse a JSON file in one read, using orjson when available."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
-  # Save/load compositions
-  eink-compose save my_template.json
-  eink-compose load my_template.json
-  eink-compose load my_template.json --render --output final.png
-
-  # Session management
-  eink-compose reset                   # Clear session, create new 250x128
-  eink-compose reset --size 240x416    # Clear session, create custom size
 
-  # Hardware control
-  eink-compose hardware info   # Show display info
-  eink-compose hardware clear  # Clear display
-  eink-compose hardware sleep  # Power save mode
-""",
-    )
+def _write_json(path, data: Any):
+    """Write data to a file as 2-space indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    with open(path, "wb") as f:
+        f.write(payload)
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # Create command
-    create_cmd = subparsers.add_parser("create", help="Create new composition")
-    create_cmd.add_argument(
+def _add_create_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'create' command."""
+    cmd.add_argument(
         "--size",
         default="250x128",
         help="Display size WIDTHxHEIGHT (default: 250x128 landscape for EPD128x250)",
     )
-    create_cmd.add_argument("--output", help="Output file")
-    create_cmd.add_argument(
+    cmd.add_argument("--output", help="Output file")
+    cmd.add_argument(
         "--bg-color",
         type=int,
         default=255,
@@ -93,78 +71,73 @@ Examples:
         help="Background color: 0=black, 255=white (default: 255)",
     )
 
-    # Add image command
-    add_img_cmd = subparsers.add_parser("add-image", help="Add image layer")
-    add_img_cmd.add_argument("layer_id", help="Layer ID")
-    add_img_cmd.add_argument("image_path", help="Path to image file")
-    add_img_cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
-    add_img_cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
-    add_img_cmd.add_argument(
+
+def _add_add_image_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'add-image' command."""
+    cmd.add_argument("layer_id", help="Layer ID")
+    cmd.add_argument("image_path", help="Path to image file")
+    cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
+    cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
+    cmd.add_argument(
         "--resize-mode",
         choices=["stretch", "fit", "crop"],
         default="fit",
         help="Resize mode (default: fit)",
     )
-    add_img_cmd.add_argument(
+    cmd.add_argument(
         "--dither",
         choices=["floyd-steinberg", "threshold", "none"],
         default="floyd-steinberg",
         help="Dithering mode (default: floyd-steinberg)",
     )
-    add_img_cmd.add_argument(
-        "--brightness", type=float, default=1.0, help="Brightness (default: 1.0)"
-    )
-    add_img_cmd.add_argument("--contrast", type=float, default=0.0, help="Contrast (default: 0.0)")
-    add_img_cmd.add_argument(
-        "--rotate", type=int, default=0, help="Rotation in degrees (default: 0)"
-    )
-    add_img_cmd.add_argument("--flip-h", action="store_true", help="Flip horizontally")
-    add_img_cmd.add_argument("--flip-v", action="store_true", help="Flip vertically")
-    add_img_cmd.add_argument("--crop-x", type=int, help="X position for crop (for crop mode)")
-    add_img_cmd.add_argument("--crop-y", type=int, help="Y position for crop (for crop mode)")
-    add_img_cmd.add_argument("--width", type=int, help="Custom width for the image")
-    add_img_cmd.add_argument("--height", type=int, help="Custom height for the image")
-
-    # Add text command
-    add_txt_cmd = subparsers.add_parser("add-text", help="Add text layer")
-    add_txt_cmd.add_argument("layer_id", help="Layer ID")
-    add_txt_cmd.add_argument("text", help="Text to display")
-    add_txt_cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
-    add_txt_cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
-    add_txt_cmd.add_argument(
+    cmd.add_argument("--brightness", type=float, default=1.0, help="Brightness (default: 1.0)")
+    cmd.add_argument("--contrast", type=float, default=0.0, help="Contrast (default: 0.0)")
+    cmd.add_argument("--rotate", type=int, default=0, help="Rotation in degrees (default: 0)")
+    cmd.add_argument("--flip-h", action="store_true", help="Flip horizontally")
+    cmd.add_argument("--flip-v", action="store_true", help="Flip vertically")
+    cmd.add_argument("--crop-x", type=int, help="X position for crop (for crop mode)")
+    cmd.add_argument("--crop-y", type=int, help="Y position for crop (for crop mode)")
+    cmd.add_argument("--width", type=int, help="Custom width for the image")
+    cmd.add_argument("--height", type=int, help="Custom height for the image")
+
+
+def _add_add_text_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'add-text' command."""
+    cmd.add_argument("layer_id", help="Layer ID")
+    cmd.add_argument("text", help="Text to display")
+    cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
+    cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
+    cmd.add_argument(
         "--color",
         type=int,
         default=0,
         choices=[0, 255],
         help="Text color: 0=black, 255=white (default: 0)",
     )
-    add_txt_cmd.add_argument(
-        "--rotate", type=int, default=0, help="Rotation in degrees (default: 0)"
-    )
-    add_txt_cmd.add_argument("--flip-h", action="store_true", help="Flip text horizontally")
-    add_txt_cmd.add_argument("--flip-v", action="store_true", help="Flip text vertically")
-    add_txt_cmd.add_argument(
+    cmd.add_argument("--rotate", type=int, default=0, help="Rotation in degrees (default: 0)")
+    cmd.add_argument("--flip-h", action="store_true", help="Flip text horizontally")
+    cmd.add_argument("--flip-v", action="store_true", help="Flip text vertically")
+    cmd.add_argument(
         "--font-size",
         type=int,
         default=1,
         help="Font scale factor: 1=normal, 2=double, etc. (default: 1)",
     )
-    add_txt_cmd.add_argument(
-        "--background", action="store_true", help="Add white background behind text"
-    )
-    add_txt_cmd.add_argument(
+    cmd.add_argument("--background", action="store_true", help="Add white background behind text")
+    cmd.add_argument(
         "--padding", type=int, default=2, help="Padding around background in pixels (default: 2)"
     )
 
-    # Add rectangle command
-    add_rect_cmd = subparsers.add_parser("add-rect", help="Add rectangle layer")
-    add_rect_cmd.add_argument("layer_id", help="Layer ID")
-    add_rect_cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
-    add_rect_cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
-    add_rect_cmd.add_argument("--width", type=int, default=10, help="Width (default: 10)")
-    add_rect_cmd.add_argument("--height", type=int, default=10, help="Height (default: 10)")
-    add_rect_cmd.add_argument("--filled", action="store_true", help="Fill rectangle")
-    add_rect_cmd.add_argument(
+
+def _add_add_rect_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'add-rect' command."""
+    cmd.add_argument("layer_id", help="Layer ID")
+    cmd.add_argument("--x", type=int, default=0, help="X position (default: 0)")
+    cmd.add_argument("--y", type=int, default=0, help="Y position (default: 0)")
+    cmd.add_argument("--width", type=int, default=10, help="Width (default: 10)")
+    cmd.add_argument("--height", type=int, default=10, help="Height (default: 10)")
+    cmd.add_argument("--filled", action="store_true", help="Fill rectangle")
+    cmd.add_argument(
         "--color",
         type=int,
         default=0,
@@ -172,42 +145,43 @@ Examples:
         help="Rectangle color: 0=black, 255=white (default: 0)",
     )
 
-    # Remove layer command
-    remove_cmd = subparsers.add_parser("remove", help="Remove layer")
-    remove_cmd.add_argument("layer_id", help="Layer ID to remove")
 
-    # Toggle layer command
-    toggle_cmd = subparsers.add_parser("toggle", help="Toggle layer visibility")
-    toggle_cmd.add_argument("layer_id", help="Layer ID to toggle")
+def _add_remove_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'remove' command."""
+    cmd.add_argument("layer_id", help="Layer ID to remove")
 
-    # Reset session command
-    reset_cmd = subparsers.add_parser("reset", help="Reset/clear the current session")
-    reset_cmd.add_argument(
+
+def _add_toggle_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'toggle' command."""
+    cmd.add_argument("layer_id", help="Layer ID to toggle")
+
+
+def _add_reset_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'reset' command."""
+    cmd.add_argument(
         "--size", default="250x128", help="Display size for new session (default: 250x128)"
     )
 
-    # List layers command
-    subparsers.add_parser("list", help="List all layers")
 
-    # Render command
-    render_cmd = subparsers.add_parser("render", help="Render composition")
-    render_cmd.add_argument("--output", required=True, help="Output file")
-    render_cmd.add_argument(
+def _add_render_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'render' command."""
+    cmd.add_argument("--output", required=True, help="Output file")
+    cmd.add_argument(
         "--format",
         choices=["png", "binary", "bmp"],
         default="png",
         help="Output format (default: png)",
     )
-    render_cmd.add_argument(
+    cmd.add_argument(
         "--dither", choices=["floyd-steinberg", "threshold", "none"], help="Final dithering pass"
     )
-    render_cmd.add_argument(
+    cmd.add_argument(
         "--transform",
         action="append",
         choices=["flip-h", "flip-v", "rotate-90", "invert"],
         help="Apply transformations (can be used multiple times)",
     )
-    render_cmd.add_argument(
+    cmd.add_argument(
         "--bg-color",
         type=int,
         default=255,
@@ -215,45 +189,139 @@ Examples:
         help="Background color: 0=black, 255=white (default: 255)",
     )
 
-    # Save composition command
-    save_cmd = subparsers.add_parser("save", help="Save composition to JSON")
-    save_cmd.add_argument("filename", help="Output JSON file")
 
-    # Load composition command
-    load_cmd = subparsers.add_parser("load", help="Load composition from JSON")
-    load_cmd.add_argument("filename", help="Input JSON file")
-    load_cmd.add_argument("--render", action="store_true", help="Render after loading")
-    load_cmd.add_argument("--output", help="Output file (if rendering)")
-    load_cmd.add_argument(
+def _add_save_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'save' command."""
+    cmd.add_argument("filename", help="Output JSON file")
+
+
+def _add_load_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'load' command."""
+    cmd.add_argument("filename", help="Input JSON file")
+    cmd.add_argument("--render", action="store_true", help="Render after loading")
+    cmd.add_argument("--output", help="Output file (if rendering)")
+    cmd.add_argument(
         "--format",
         choices=["png", "binary", "bmp"],
         default="png",
         help="Output format (default: png)",
     )
 
-    # Display command (hardware)
-    if HARDWARE_AVAILABLE:
-        display_cmd = subparsers.add_parser("display", help="Display composition on e-ink hardware")
-        display_cmd.add_argument(
-            "--partial", action="store_true", help="Use partial refresh (faster but may ghost)"
-        )
-        display_cmd.add_argument(
-            "--rotate", action="store_true", help="Rotate image 90° counter-clockwise"
-        )
-        display_cmd.add_argument("--flip-h", action="store_true", help="Flip image horizontally")
-        display_cmd.add_argument(
-            "--clear", action="store_true", help="Clear display before showing"
-        )
-        display_cmd.add_argument("--save-preview", help="Save preview PNG to file")
 
-    # Hardware control commands
-    if HARDWARE_AVAILABLE:
-        hw_group = subparsers.add_parser("hardware", help="Hardware control commands")
-        hw_subparsers = hw_group.add_subparsers(dest="hw_command", help="Hardware commands")
+def _add_display_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'display' command."""
+    cmd.add_argument(
+        "--partial", action="store_true", help="Use partial refresh (faster but may ghost)"
+    )
+    cmd.add_argument("--rotate", action="store_true", help="Rotate image 90° counter-clockwise")
+    cmd.add_argument("--flip-h", action="store_true", help="Flip image horizontally")
+    cmd.add_argument("--clear", action="store_true", help="Clear display before showing")
+    cmd.add_argument("--save-preview", help="Save preview PNG to file")
+
+
+def _add_hardware_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'hardware' command."""
+    hw_subparsers = cmd.add_subparsers(dest="hw_command", help="Hardware commands")
+
+    hw_subparsers.add_parser("clear", help="Clear the e-ink display")
+    hw_subparsers.add_parser("sleep", help="Put display to sleep mode")
+    hw_subparsers.add_parser("info", help="Show display information")
+
+
+def _add_batch_arguments(cmd: argparse.ArgumentParser):
+    """Add the arguments of the 'batch' command."""
+    cmd.add_argument("file", help="File with one command per line, or - for stdin")
+
+
+# Subcommand name -> (help text, function adding its arguments). Only the
+# subcommand being run has its arguments built; see create_parser().
+_COMMANDS: Dict[str, Tuple[str, Optional[Callable[[argparse.ArgumentParser], None]]]] = {
+    "create": ("Create new composition", _add_create_arguments),
+    "add-image": ("Add image layer", _add_add_image_arguments),
+    "add-text": ("Add text layer", _add_add_text_arguments),
+    "add-rect": ("Add rectangle layer", _add_add_rect_arguments),
+    "remove": ("Remove layer", _add_remove_arguments),
+    "toggle": ("Toggle layer visibility", _add_toggle_arguments),
+    "reset": ("Reset/clear the current session", _add_reset_arguments),
+    "list": ("List all layers", None),
+    "render": ("Render composition", _add_render_arguments),
+    "save": ("Save composition to JSON", _add_save_arguments),
+    "load": ("Load composition from JSON", _add_load_arguments),
+    "display": ("Display composition on e-ink hardware", _add_display_arguments),
+    "hardware": ("Hardware control commands", _add_hardware_arguments),
+    "batch": ("Run several commands in one process", _add_batch_arguments),
+}
+
+
+def create_parser(command: Optional[str] = None):
+    """
+    Create command line argument parser.
+
+    Args:
+        command: Subcommand that is going to be parsed, or None to build the
+            arguments of every subcommand
+    """
+    parser = argparse.ArgumentParser(
+        description="E-ink display image composer - Create layered templates for e-ink displays",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # IMPORTANT: Always create a composition first!
+  # Standard e-ink display: EPD128x250 (physically mounted as 250×128 landscape)
+  # Note: Create images in 250×128 landscape, use rotate=90 when displaying
+
+  # Working example for EPD128x250 hardware:
+  eink-compose create --size 250x128
+  eink-compose add-text hello "HELLO E-INK" --x 50 --y 60
+  eink-compose add-rect border --width 250 --height 128 --filled false
+  eink-compose display --rotate
+
+  # More detailed example:
+  eink-compose create --size 250x128
+  eink-compose add-rect bg --width 250 --height 128 --filled true --color 255
+  eink-compose add-text title "E-INK DISPLAY" --x 70 --y 40
+  eink-compose add-text info "250 x 128 px" --x 85 --y 60
+  eink-compose add-rect frame --x 50 --y 20 --width 150 --height 88 --filled false
+  eink-compose display --rotate --save-preview preview.png
+
+  # Render to file
+  eink-compose render --output display.png --format png
+  eink-compose render --output display.bin --format binary --dither floyd-steinberg
+
+  # Display options
+  eink-compose display                    # Full refresh
+  eink-compose display --partial          # Fast refresh (may ghost)
+  eink-compose display --rotate --flip-h  # With transformations
 
-        hw_subparsers.add_parser("clear", help="Clear the e-ink display")
-        hw_subparsers.add_parser("sleep", help="Put display to sleep mode")
-        hw_subparsers.add_parser("info", help="Show display information")
+  # Save/load compositions
+  eink-compose save my_template.json
+  eink-compose load my_template.json
+  eink-compose load my_template.json --render --output final.png
+
+  # Session management
+  eink-compose reset                   # Clear session, create new 250x128
+  eink-compose reset --size 240x416    # Clear session, create custom size
+
+  # Run many commands in one process (the session is saved once)
+  printf '%s\n' 'create --size 250x128' 'add-text title "HELLO" --x 70 --y 40' | eink-compose batch -
+  eink-compose batch commands.txt
+
+  # Hardware control
+  eink-compose hardware info   # Show display info
+  eink-compose hardware clear  # Clear display
+  eink-compose hardware sleep  # Power save mode
+""",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Every subcommand is listed (for help and usage errors), but building the
+    # arguments of all of them dominates startup for a one-shot command, so when
+    # the command is known only its own arguments are added
+    for name, (help_text, add_arguments) in _COMMANDS.items():
+        cmd = subparsers.add_parser(name, help=help_text)
+        if add_arguments is not None and command in (None, name):
+            add_arguments(cmd)
 
     return parser
 
@@ -261,53 +329,130 @@ Examples:
 class ComposerSession:
     """Manage composer state between commands."""
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        """
+        Args:
+            lazy: Defer reading the session file until a command needs the existing
+                composition (see load_if_needed)
+        """
         self.composer = None
-        self.session_file = Path.home() / ".eink_composer_session.json"
-        self.load_session()
-
-    def ensure_composer(self, default_width=250, default_height=128):
+        self._loaded = False
+        # While set, save_session() only records that a save is due (see batch)
+        self.defer_saves = False
+        self.save_pending = False
+        if not lazy:
+            self.load_if_needed()
+
+    @property
+    def composer(self) -> Optional[EinkComposer]:
+        """The current composition."""
+        return self._composer
+
+    @composer.setter
+    def composer(self, composer: Optional[EinkComposer]):
+        self._composer = composer
+        # A composition set directly (create, reset, load) replaces the saved one,
+        # so load_if_needed() must not read the session file over it later
+        self._loaded = True
+        # Saved layer info, kept in step with single-layer edits so that saving
+        # doesn't walk every layer again; None means rebuild from the composer
+        self._layer_info: Optional[List[Dict[str, Any]]] = None
+
+    @functools.cached_property
+    def session_file(self) -> Path:
+        """Path of the session file in the user's home directory."""
+        return Path.home() / ".eink_composer_session.json"
+
+    def load_if_needed(self):
+        """Load the session from file unless it has already been loaded."""
+        if not self._loaded:
+            self._loaded = True
+            self.load_session()
+
+    def ensure_composer(self, default_width=250, default_height=128) -> EinkComposer:
         """Ensure a composer exists, creating a default one if needed. Default is 250×128 landscape for EPD128x250."""
-        if not self.composer:
+        self.load_if_needed()
+        composer = self.composer
+        if composer is None:
             print(
                 f"No active composition found. Creating default {default_width}x{default_height} composition..."
             )
-            self.composer = EinkComposer(default_width, default_height)
+            composer = EinkComposer(default_width, default_height)
+            self.composer = composer
             self.save_session()
             print(f"✓ Created default {default_width}x{default_height} composition")
+        return composer
 
     def load_session(self):
         """Load session from file."""
-        if self.session_file.exists():
-            try:
-                with open(self.session_file) as f:
-                    data = json.load(f)
-                    self.composer = EinkComposer(data["width"], data["height"])
-                    # Restore layers
-                    for layer_data in data.get("layers", []):
-                        self._restore_layer(layer_data)
-            except Exception as e:
-                print(f"Warning: Could not load session: {e}", file=sys.stderr)
-                self.composer = None
+        try:
+            # A missing file is not an error
+            data = _read_json(self.session_file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Warning: Could not load session: {e}", file=sys.stderr)
+            self.composer = None
+            return
+
+        try:
+            composer = EinkComposer(data["width"], data["height"])
+            self.composer = composer
+            # Restore layers, describing each one from the layer the composer now holds
+            # rather than the saved dict, which may miss or add keys
+            layers = []
+            for layer_data in data.get("layers", []):
+                if self._restore_layer(composer, layer_data):
+                    layers.append(layer_info(composer.layers[-1]))
+            self._layer_info = layers
+        except Exception as e:
+            print(f"Warning: Could not load session: {e}", file=sys.stderr)
+            self.composer = None
 
     def save_session(self):
         """Save session to file."""
+        if self.defer_saves:
+            self.save_pending = True
+            return
+        self.save_pending = False
         if self.composer:
             data = {
                 "width": self.composer.width,
                 "height": self.composer.height,
-                "layers": self.composer.get_layer_info(),
+                "layers": self.get_layer_info(),
             }
-            with open(self.session_file, "w") as f:
-                json.dump(data, f, indent=2)
-
-    def _restore_layer(self, layer_data: Dict[str, Any]):
-        """Restore a layer from saved data."""
+            _write_json(self.session_file, data)
+
+    def get_layer_info(self) -> List[Dict[str, Any]]:
+        """Get information about all layers of the current composition."""
+        if self._layer_info is None:
+            self._layer_info = self.composer.get_layer_info() if self.composer else []
+        return self._layer_info
+
+    def layer_added(self):
+        """Record the layer that was just added to the composer."""
+        if self._layer_info is not None:
+            self._layer_info.append(layer_info(self.composer.layers[-1]))
+
+    def layer_removed(self, layer_id: str):
+        """Record that all layers with layer_id were removed from the composer."""
+        if self._layer_info is not None:
+            self._layer_info = [info for info in self._layer_info if info["id"] != layer_id]
+
+    def layer_toggled(self, layer_id: str):
+        """Record that the first layer with layer_id had its visibility toggled."""
+        for info in self._layer_info or ():
+            if info["id"] == layer_id:
+                info["visible"] = not info["visible"]
+                break
+
+    def _restore_layer(self, composer: EinkComposer, layer_data: Dict[str, Any]) -> bool:
+        """Restore a layer from saved data into composer, returning False for unknown types."""
         layer_type = layer_data["type"]
         layer_id = layer_data["id"]
 
         if layer_type == "image":
-            self.composer.add_image_layer(
+            composer.add_image_layer(
                 layer_id=layer_id,
                 image_path=layer_data.get("image_path", ""),
                 x=layer_data["x"],
@@ -325,7 +470,7 @@ class ComposerSession:
                 height=layer_data.get("height", None),
             )
         elif layer_type == "text":
-            self.composer.add_text_layer(
+            composer.add_text_layer(
                 layer_id=layer_id,
                 text=layer_data.get("text", ""),
                 x=layer_data["x"],
@@ -339,7 +484,7 @@ class ComposerSession:
                 padding=layer_data.get("padding", 2),
             )
         elif layer_type == "rectangle":
-            self.composer.add_rectangle_layer(
+            composer.add_rectangle_layer(
                 layer_id=layer_id,
                 x=layer_data["x"],
                 y=layer_data["y"],
@@ -348,23 +493,63 @@ class ComposerSession:
                 filled=layer_data.get("filled", True),
                 color=layer_data.get("color", 0),
             )
+        else:
+            return False
 
         if not layer_data.get("visible", True):
-            self.composer.toggle_layer(layer_id)
+            composer.toggle_layer(layer_id)
+        return True
 
 
-def main():
-    """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+def _parse_args(argv: List[str]) -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
+    """Parse one command line, building only the arguments of its subcommand."""
+    parser = create_parser(argv[0] if argv and argv[0] in _COMMANDS else None)
+    return parser, parser.parse_args(argv)
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
 
-    session = ComposerSession()
+def _run_batch(source: str, session: ComposerSession):
+    """
+    Run eink-compose commands, one per line, from a file or stdin ("-").
+
+    Lines use shell quoting; blank lines and # comments are skipped and a leading
+    "eink-compose" is optional. All commands share one session, which is written
+    once at the end instead of after every command. If a command fails, the
+    session is still written with the changes made so far and the batch stops.
+    """
+    stream = sys.stdin if source == "-" else open(source)
+    session.defer_saves = True
+    try:
+        for line_no, line in enumerate(stream, 1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as e:
+                print(f"Error: line {line_no}: {e}", file=sys.stderr)
+                sys.exit(1)
+            if argv and argv[0] == "eink-compose":
+                argv = argv[1:]
+            if not argv:
+                continue
+            if argv[0] == "batch":
+                print(f"Error: line {line_no}: batch can't be nested", file=sys.stderr)
+                sys.exit(1)
+
+            try:
+                _, args = _parse_args(argv)
+                _run_command(args, session)
+            except SystemExit as e:
+                if e.code:
+                    print(f"Error: batch stopped at line {line_no}", file=sys.stderr)
+                    raise
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        session.defer_saves = False
+        if session.save_pending:
+            session.save_session()
+
 
-    # Handle commands
+def _run_command(args: argparse.Namespace, session: ComposerSession):
+    """Run one parsed command against the session."""
     if args.command == "create":
         # Parse size
         try:
@@ -373,18 +558,19 @@ def main():
             print(f"Error: Invalid size format '{args.size}'. Use WIDTHxHEIGHT", file=sys.stderr)
             sys.exit(1)
 
-        session.composer = EinkComposer(width, height)
+        composer = EinkComposer(width, height)
+        session.composer = composer
         session.save_session()
         print(f"Created new {width}x{height} composition")
 
         if args.output:
-            session.composer.save(args.output)
+            composer.save(args.output)
             print(f"Saved to {args.output}")
 
     elif args.command == "add-image":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        session.composer.add_image_layer(
+        composer.add_image_layer(
             layer_id=args.layer_id,
             image_path=args.image_path,
             x=args.x,
@@ -401,13 +587,14 @@ def main():
             width=args.width,
             height=args.height,
         )
+        session.layer_added()
         session.save_session()
         print(f"Added image layer '{args.layer_id}'")
 
     elif args.command == "add-text":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        session.composer.add_text_layer(
+        composer.add_text_layer(
             layer_id=args.layer_id,
             text=args.text,
             x=args.x,
@@ -420,13 +607,14 @@ def main():
             background=args.background,
             padding=args.padding,
         )
+        session.layer_added()
         session.save_session()
         print(f"Added text layer '{args.layer_id}'")
 
     elif args.command == "add-rect":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        session.composer.add_rectangle_layer(
+        composer.add_rectangle_layer(
             layer_id=args.layer_id,
             x=args.x,
             y=args.y,
@@ -435,20 +623,23 @@ def main():
             filled=args.filled,
             color=args.color,
         )
+        session.layer_added()
         session.save_session()
         print(f"Added rectangle layer '{args.layer_id}'")
 
     elif args.command == "remove":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        session.composer.remove_layer(args.layer_id)
+        composer.remove_layer(args.layer_id)
+        session.layer_removed(args.layer_id)
         session.save_session()
         print(f"Removed layer '{args.layer_id}'")
 
     elif args.command == "toggle":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        session.composer.toggle_layer(args.layer_id)
+        composer.toggle_layer(args.layer_id)
+        session.layer_toggled(args.layer_id)
         session.save_session()
         print(f"Toggled visibility of layer '{args.layer_id}'")
 
@@ -472,13 +663,13 @@ def main():
         print("Session reset complete")
 
     elif args.command == "list":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
-        layers = session.composer.get_layer_info()
+        layers = session.get_layer_info()
         if not layers:
             print("No layers")
         else:
-            print(f"Composition: {session.composer.width}x{session.composer.height}")
+            print(f"Composition: {composer.width}x{composer.height}")
             print("\nLayers:")
             for layer in layers:
                 visibility = "✓" if layer["visible"] else "✗"
@@ -494,7 +685,7 @@ def main():
                     print(f"      Size: {layer['width']}x{layer['height']}")
 
     elif args.command == "render":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
         render_kwargs = {
             "background_color": args.bg_color,
@@ -502,39 +693,38 @@ def main():
             "transformations": args.transform,
         }
 
-        session.composer.save(args.output, format=args.format, **render_kwargs)
+        composer.save(args.output, format=args.format, **render_kwargs)
         print(f"Rendered to {args.output}")
 
     elif args.command == "save":
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
         data = {
-            "width": session.composer.width,
-            "height": session.composer.height,
-            "layers": session.composer.get_layer_info(),
+            "width": composer.width,
+            "height": composer.height,
+            "layers": session.get_layer_info(),
         }
 
-        with open(args.filename, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_json(args.filename, data)
 
         print(f"Saved composition to {args.filename}")
 
     elif args.command == "load":
         try:
-            with open(args.filename) as f:
-                data = json.load(f)
+            data = _read_json(args.filename)
 
-            session.composer = EinkComposer(data["width"], data["height"])
+            composer = EinkComposer(data["width"], data["height"])
+            session.composer = composer
 
             # Restore layers
             for layer_data in data.get("layers", []):
-                session._restore_layer(layer_data)
+                session._restore_layer(composer, layer_data)
 
             session.save_session()
             print(f"Loaded composition from {args.filename}")
 
             if args.render and args.output:
-                session.composer.save(args.output, format=args.format)
+                composer.save(args.output, format=args.format)
                 print(f"Rendered to {args.output}")
 
         except Exception as e:
@@ -542,12 +732,14 @@ def main():
             sys.exit(1)
 
     elif args.command == "display":
-        if not HARDWARE_AVAILABLE:
+        hardware = _load_hardware()
+        if hardware is None:
             print("Error: Hardware display not available. SDK not found.", file=sys.stderr)
             print("Run: source /opt/distiller-sdk/activate.sh", file=sys.stderr)
             sys.exit(1)
+        Display, DisplayMode, DisplayError = hardware
 
-        session.ensure_composer()
+        composer = session.ensure_composer()
 
         try:
             # Initialize display
@@ -558,26 +750,37 @@ def main():
                 display.clear()
                 print("✓ Display cleared")
 
-            # Save to temporary file
-            temp_file = "/tmp/eink_compose_display.png"
-            session.composer.save(temp_file, format="png")
-
             # Save preview if requested
             if args.save_preview:
-                session.composer.save(args.save_preview, format="png")
+                composer.save(args.save_preview, format="png")
                 print(f"✓ Preview saved to {args.save_preview}")
 
             # Display on hardware
             mode = DisplayMode.PARTIAL if args.partial else DisplayMode.FULL
 
-            # Use display_image method
+            # The raw frame carries no size, so check it against the panel the way
+            # the driver's PNG loader did; --rotate turns it 90° first
+            frame_size = (composer.width, composer.height)
+            if args.rotate:
+                frame_size = (composer.height, composer.width)
+            panel_size = display.get_dimensions()
+            if frame_size != panel_size:
+                raise DisplayError(
+                    f"Invalid image size: {frame_size[0]}x{frame_size[1]}, "
+                    f"expected {panel_size[0]}x{panel_size[1]}"
+                )
+
+            # Hand the packed 1-bit frame straight to the driver rather than writing a
+            # PNG for it to read back and decode
             display.display_image(
-                temp_file, mode=mode, rotate=args.rotate, flip_horizontal=args.flip_h
+                composer.render_raw(),
+                mode=mode,
+                rotate=args.rotate,
+                flip_horizontal=args.flip_h,
+                src_width=composer.width,
+                src_height=composer.height,
             )
 
-            # Clean up temp file
-            os.remove(temp_file)
-
             print("✓ Displayed on e-ink hardware")
             if args.partial:
                 print("  - Used partial refresh")
@@ -591,20 +794,14 @@ def main():
             import traceback
 
             traceback.print_exc()
-
-            # Check if the temp file exists
-            if os.path.exists(temp_file):
-                print(f"Temp file exists: {temp_file}", file=sys.stderr)
-                print(f"File size: {os.path.getsize(temp_file)} bytes", file=sys.stderr)
-            else:
-                print(f"Temp file NOT found: {temp_file}", file=sys.stderr)
-
             sys.exit(1)
 
     elif args.command == "hardware":
-        if not HARDWARE_AVAILABLE:
+        hardware = _load_hardware()
+        if hardware is None:
             print("Error: Hardware control not available. SDK not found.", file=sys.stderr)
             sys.exit(1)
+        Display, _, _ = hardware
 
         try:
             display = Display()
@@ -643,6 +840,23 @@ def main():
             print(f"Error with hardware control: {e}", file=sys.stderr)
             sys.exit(1)
 
+    elif args.command == "batch":
+        _run_batch(args.file, session)
+
+
+def main():
+    """Main CLI entry point."""
+    parser, args = _parse_args(sys.argv[1:])
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    # Commands that read the current composition load it through ensure_composer();
+    # create, reset, load and hardware never need it
+    session = ComposerSession(lazy=True)
+    _run_command(args, session)
+
 
 if __name__ == "__main__":
     main()
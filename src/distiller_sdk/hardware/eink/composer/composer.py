@@ -4,7 +4,7 @@ from typing import List, Dict, Optional, Literal, Any
 from dataclasses import dataclass, field
 
 from .dithering import floyd_steinberg_dither, threshold_dither, pack_bits
-from .image_ops import resize_image, flip_horizontal, rotate_ccw_90, invert_colors
+from .image_ops import resize_image, apply_transforms, pack_1bpp
 from .text import render_text, measure_text
 
 
@@ -65,6 +65,80 @@ class RectangleLayer(Layer):
     color: int = 0
 
 
+def layer_info(layer: Layer) -> Dict[str, Any]:
+    """Get information about a single layer, as stored in saved compositions."""
+    info = {
+        "id": layer.id,
+        "type": layer.type,
+        "visible": layer.visible,
+        "x": layer.x,
+        "y": layer.y,
+    }
+
+    if isinstance(layer, ImageLayer):
+        info.update(
+            {
+                "image_path": layer.image_path,
+                "resize_mode": layer.resize_mode,
+                "dither_mode": layer.dither_mode,
+                "brightness": layer.brightness,
+                "contrast": layer.contrast,
+                "rotate": layer.rotate,
+                "flip_h": layer.flip_h,
+                "flip_v": layer.flip_v,
+                "crop_x": layer.crop_x,
+                "crop_y": layer.crop_y,
+                "width": layer.width,
+                "height": layer.height,
+            }
+        )
+        # Include placeholder_type if it exists (for QR codes, etc.)
+        if hasattr(layer, "placeholder_type"):
+            info["placeholder_type"] = layer.placeholder_type
+        if hasattr(layer, "error_correction"):
+            info["error_correction"] = layer.error_correction
+    elif isinstance(layer, TextLayer):
+        info.update(
+            {
+                "text": layer.text,
+                "color": layer.color,
+                "rotate": layer.rotate,
+                "flip_h": layer.flip_h,
+                "flip_v": layer.flip_v,
+                "font_size": layer.font_size,
+                "background": layer.background,
+                "padding": layer.padding,
+            }
+        )
+        # Include placeholder_type if it exists (for IP placeholders, etc.)
+        if hasattr(layer, "placeholder_type"):
+            info["placeholder_type"] = layer.placeholder_type
+    elif isinstance(layer, RectangleLayer):
+        info.update(
+            {
+                "width": layer.width,
+                "height": layer.height,
+                "filled": layer.filled,
+                "color": layer.color,
+            }
+        )
+
+    return info
+
+
+def _layer_transform_ops(layer) -> List[str]:
+    """Transform ops for a layer's flip_h/flip_v/rotate settings, in that order."""
+    ops = []
+    if layer.flip_h:
+        ops.append("flip-h")
+    if layer.flip_v:
+        ops.append("flip-v")
+    if layer.rotate != 0:
+        # Normalize rotation to 0, 90, 180, 270
+        ops.extend(["rotate-90"] * ((layer.rotate % 360) // 90))
+    return ops
+
+
 class EinkComposer:
     """
     E-ink display composer for creating layered templates.
@@ -88,7 +162,7 @@ class EinkComposer:
     def add_image_layer(
         self,
         layer_id: str,
-        image_path: str,
+        image_path: Optional[str] = None,
         x: int = 0,
         y: int = 0,
         resize_mode: Literal["stretch", "fit", "crop"] = "fit",
@@ -102,13 +176,14 @@ class EinkComposer:
         crop_y: Optional[int] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
+        image_data: Optional[np.ndarray] = None,
     ) -> str:
         """
         Add an image layer.
 
         Args:
             layer_id: Unique layer identifier
-            image_path: Path to image file
+            image_path: Path to image file (not needed when image_data is given)
             x, y: Position on canvas
             resize_mode: How to resize image
             dither_mode: Dithering algorithm to use
@@ -121,6 +196,8 @@ class EinkComposer:
             crop_y: Y position for crop when resize_mode='crop' (None = center)
             width: Custom width for the image (None = auto-calculate from canvas)
             height: Custom height for the image (None = auto-calculate from canvas)
+            image_data: Grayscale image already in memory; used instead of image_path.
+                It is read but never modified, so it may be shared between layers
 
         Returns:
             Layer ID
@@ -130,6 +207,7 @@ class EinkComposer:
             x=x,
             y=y,
             image_path=image_path,
+            image_data=image_data,
             resize_mode=resize_mode,
             dither_mode=dither_mode,
             brightness=brightness,
@@ -325,20 +403,9 @@ class EinkComposer:
         else:
             return
 
-        # Apply transformations first (before resizing)
-        if layer.flip_h:
-            img = flip_horizontal(img)
-        if layer.flip_v:
-            from .image_ops import flip_vertical
-
-            img = flip_vertical(img)
-
-        # Apply rotation
-        if layer.rotate != 0:
-            # Normalize rotation to 0, 90, 180, 270
-            rotations = (layer.rotate % 360) // 90
-            for _ in range(rotations):
-                img = rotate_ccw_90(img)
+        # Apply transformations first (before resizing): flips, then rotation
+        # normalized to 0, 90, 180, 270, folded into a single pass
+        img = apply_transforms(img, _layer_transform_ops(layer))
 
         # Calculate target size based on custom dimensions or canvas size
         # After rotation, dimensions might have changed
@@ -387,9 +454,6 @@ class EinkComposer:
         if not layer.visible or not layer.text:
             return
 
-        # Import text functions
-        from .image_ops import rotate_ccw_90, flip_horizontal
-
         # Measure text dimensions
         text_width, text_height = measure_text(layer.text, layer.font_size)
 
@@ -417,18 +481,8 @@ class EinkComposer:
         # Render text on temporary canvas
         render_text(layer.text, text_x, text_y, temp_canvas, layer.color, layer.font_size)
 
-        # Apply flipping if needed
-        if layer.flip_h:
-            temp_canvas = flip_horizontal(temp_canvas)
-        if layer.flip_v:
-            temp_canvas = np.flipud(temp_canvas)  # Vertical flip using numpy
-
-        # Apply rotation if needed
-        if layer.rotate != 0:
-            # Normalize rotation to 0, 90, 180, 270
-            rotations = (layer.rotate % 360) // 90
-            for _ in range(rotations):
-                temp_canvas = rotate_ccw_90(temp_canvas)
+        # Apply flipping and rotation if needed
+        temp_canvas = apply_transforms(temp_canvas, _layer_transform_ops(layer), inplace=True)
 
         # Composite onto main canvas
         h, w = temp_canvas.shape
@@ -507,19 +561,10 @@ class EinkComposer:
         elif final_dither == "threshold":
             result = threshold_dither(result)
 
-        # Apply transformations
+        # Apply transformations, fused into at most two passes; result is always a
+        # private copy of the canvas by now, so it may be inverted in place
         if transformations:
-            for transform in transformations:
-                if transform == "flip-h":
-                    result = flip_horizontal(result)
-                elif transform == "flip-v":
-                    from .image_ops import flip_vertical
-
-                    result = flip_vertical(result)
-                elif transform == "rotate-90":
-                    result = rotate_ccw_90(result)
-                elif transform == "invert":
-                    result = invert_colors(result)
+            result = apply_transforms(result, transformations, inplace=True)
 
         return result
 
@@ -533,6 +578,21 @@ class EinkComposer:
         img = self.render(**kwargs)
         return pack_bits(img)
 
+    def render_raw(self, **kwargs) -> bytes:
+        """
+        Render and return 1-bit data in the layout the e-ink driver expects.
+
+        Unlike render_binary(), rows are not padded to whole bytes: pixels are packed
+        MSB first as one continuous bit stream, white where the value is above 128,
+        the same as the display library's PNG conversion.
+
+        Returns:
+            Packed binary data, (width * height + 7) // 8 bytes
+        """
+        img = self.render(**kwargs)
+        # A single row packs the whole image without padding at row ends
+        return pack_1bpp(img.reshape(1, -1)).tobytes()
+
     def save(self, filename: str, format: Literal["png", "binary", "bmp"] = "png", **render_kwargs):
         """
         Save rendered image to file.
@@ -543,9 +603,10 @@ class EinkComposer:
             **render_kwargs: Arguments passed to render()
         """
         if format == "binary":
-            data = self.render_binary(**render_kwargs)
-            with open(filename, "wb") as f:
-                f.write(data)
+            # Same data as render_binary(), written straight from the packed array
+            # without building a bytes copy first
+            img = self.render(**render_kwargs)
+            pack_1bpp(img).tofile(filename)
         else:
             img = self.render(**render_kwargs)
 
@@ -559,64 +620,4 @@ class EinkComposer:
 
     def get_layer_info(self) -> List[Dict[str, Any]]:
         """Get information about all layers."""
-        info = []
-        for layer in self.layers:
-            layer_info = {
-                "id": layer.id,
-                "type": layer.type,
-                "visible": layer.visible,
-                "x": layer.x,
-                "y": layer.y,
-            }
-
-            if isinstance(layer, ImageLayer):
-                layer_info.update(
-                    {
-                        "image_path": layer.image_path,
-                        "resize_mode": layer.resize_mode,
-                        "dither_mode": layer.dither_mode,
-                        "brightness": layer.brightness,
-                        "contrast": layer.contrast,
-                        "rotate": layer.rotate,
-                        "flip_h": layer.flip_h,
-                        "flip_v": layer.flip_v,
-                        "crop_x": layer.crop_x,
-                        "crop_y": layer.crop_y,
-                        "width": layer.width,
-                        "height": layer.height,
-                    }
-                )
-                # Include placeholder_type if it exists (for QR codes, etc.)
-                if hasattr(layer, "placeholder_type"):
-                    layer_info["placeholder_type"] = layer.placeholder_type
-                if hasattr(layer, "error_correction"):
-                    layer_info["error_correction"] = layer.error_correction
-            elif isinstance(layer, TextLayer):
-                layer_info.update(
-                    {
-                        "text": layer.text,
-                        "color": layer.color,
-                        "rotate": layer.rotate,
-                        "flip_h": layer.flip_h,
-                        "flip_v": layer.flip_v,
-                        "font_size": layer.font_size,
-                        "background": layer.background,
-                        "padding": layer.padding,
-                    }
-                )
-                # Include placeholder_type if it exists (for IP placeholders, etc.)
-                if hasattr(layer, "placeholder_type"):
-                    layer_info["placeholder_type"] = layer.placeholder_type
-            elif isinstance(layer, RectangleLayer):
-                layer_info.update(
-                    {
-                        "width": layer.width,
-                        "height": layer.height,
-                        "filled": layer.filled,
-                        "color": layer.color,
-                    }
-                )
-
-            info.append(layer_info)
-
-        return info
+        return [layer_info(layer) for layer in self.layers]
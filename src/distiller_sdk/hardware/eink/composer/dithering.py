@@ -1,31 +1,27 @@
 import numpy as np
 
+from .image_ops import pack_1bpp
 
-def floyd_steinberg_dither(image: np.ndarray) -> np.ndarray:
-    """
-    Apply Floyd-Steinberg dithering to convert grayscale image to 1-bit monochrome.
+# Numba is optional; without it error diffusion runs as a plain Python loop
+try:
+    from numba import njit
 
-    Args:
-        image: Input grayscale image as numpy array (0-255 values)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-    Returns:
-        Binary image (0 or 255 values)
-    """
-    # Ensure we're working with a float copy
-    img = image.astype(np.float32).copy()
-    height, width = img.shape
 
-    # Process each pixel
+def _diffuse_errors_jit(img: np.ndarray, out: np.ndarray, threshold: float) -> None:
+    """Floyd-Steinberg over a float32 working copy, writing 0/255 into out (Numba)."""
+    height, width = img.shape
     for y in range(height):
         for x in range(width):
             old_pixel = img[y, x]
-            new_pixel = 255 if old_pixel > 128 else 0
-            img[y, x] = new_pixel
+            new_pixel = 255.0 if old_pixel > threshold else 0.0
+            out[y, x] = np.uint8(new_pixel)
 
             # Calculate and distribute error
             error = old_pixel - new_pixel
-
-            # Distribute error to neighboring pixels
             if x + 1 < width:
                 img[y, x + 1] += error * 7 / 16
             if y + 1 < height:
@@ -35,7 +31,65 @@ def floyd_steinberg_dither(image: np.ndarray) -> np.ndarray:
                 if x + 1 < width:
                     img[y + 1, x + 1] += error * 1 / 16
 
-    return img.astype(np.uint8)
+
+if NUMBA_AVAILABLE:
+    _diffuse_errors_jit = njit(cache=True, boundscheck=False)(_diffuse_errors_jit)
+
+
+def _diffuse_errors_py(image: np.ndarray, out: np.ndarray, threshold: float) -> None:
+    """
+    Floyd-Steinberg in pure Python, writing 0/255 into out.
+
+    Only the current and next row are kept, as Python float lists: indexing lists
+    is several times cheaper than indexing numpy scalars one pixel at a time.
+    """
+    height, width = image.shape
+    current = image[0].astype(np.float64).tolist()
+    for y in range(height):
+        below = image[y + 1].astype(np.float64).tolist() if y + 1 < height else None
+        row = [0] * width
+        for x in range(width):
+            old_pixel = current[x]
+            new_pixel = 255 if old_pixel > threshold else 0
+            row[x] = new_pixel
+
+            # Calculate and distribute error
+            error = old_pixel - new_pixel
+            if x + 1 < width:
+                current[x + 1] += error * 7 / 16
+            if below is not None:
+                if x > 0:
+                    below[x - 1] += error * 3 / 16
+                below[x] += error * 5 / 16
+                if x + 1 < width:
+                    below[x + 1] += error * 1 / 16
+        out[y] = row
+        current = below
+
+
+def floyd_steinberg_dither(image: np.ndarray, threshold: int = 128) -> np.ndarray:
+    """
+    Apply Floyd-Steinberg dithering to convert grayscale image to 1-bit monochrome.
+
+    The per-pixel error diffusion is sequential, so it can't be vectorized with
+    NumPy; it is JIT-compiled with Numba when that is installed.
+
+    Args:
+        image: Input grayscale image as numpy array (0-255 values)
+        threshold: Threshold value (default: 128)
+
+    Returns:
+        Binary image (0 or 255 values)
+    """
+    out = np.empty(image.shape, dtype=np.uint8)
+    if out.size == 0:
+        return out
+
+    if NUMBA_AVAILABLE:
+        _diffuse_errors_jit(image.astype(np.float32), out, float(threshold))
+    else:
+        _diffuse_errors_py(image, out, threshold)
+    return out
 
 
 def threshold_dither(image: np.ndarray, threshold: int = 128) -> np.ndarray:
@@ -63,18 +117,7 @@ def pack_bits(image: np.ndarray) -> bytes:
     Returns:
         Packed bytes
     """
-    height, width = image.shape
-    packed_width = (width + 7) // 8
-    packed = bytearray(packed_width * height)
-
-    for y in range(height):
-        for x in range(width):
-            if image[y, x] > 128:  # White pixel
-                byte_idx = y * packed_width + x // 8
-                bit_idx = 7 - (x % 8)
-                packed[byte_idx] |= 1 << bit_idx
-
-    return bytes(packed)
+    return pack_1bpp(image).tobytes()
 
 
 def unpack_bits(data: bytes, width: int, height: int) -> np.ndarray:
@@ -90,13 +133,6 @@ def unpack_bits(data: bytes, width: int, height: int) -> np.ndarray:
         Binary image array (0 or 255 values)
     """
     packed_width = (width + 7) // 8
-    image = np.zeros((height, width), dtype=np.uint8)
-
-    for y in range(height):
-        for x in range(width):
-            byte_idx = y * packed_width + x // 8
-            bit_idx = 7 - (x % 8)
-            if data[byte_idx] & (1 << bit_idx):
-                image[y, x] = 255
-
-    return image
+    packed = np.frombuffer(data, dtype=np.uint8, count=height * packed_width)
+    bits = np.unpackbits(packed.reshape(height, packed_width), axis=1, count=width)
+    return bits * np.uint8(255)
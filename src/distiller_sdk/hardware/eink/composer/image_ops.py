@@ -1,6 +1,14 @@
+import functools
+
 import numpy as np
-from PIL import Image, ImageEnhance, ImageOps
-from typing import Literal, Optional, cast
+import cv2  # type: ignore
+from PIL import Image
+from typing import Literal, Optional, Sequence
+
+# Downscales first shrink by an integer factor with a cheap box reduce until the
+# image is within this factor of the target, then finish with LANCZOS. 3.0 is
+# visually indistinguishable from a full LANCZOS resample.
+_REDUCING_GAP = 3.0
 
 
 def resize_image(
@@ -17,6 +25,7 @@ def resize_image(
 
     Note: The main Display class uses Rust backend for image processing,
     but these composer utilities use Pillow for compatibility and stability.
+    The 'stretch' mode is a plain resample and is done with OpenCV.
 
     Args:
         image: Input grayscale image as numpy array
@@ -33,27 +42,44 @@ def resize_image(
     Returns:
         Resized grayscale image
     """
-    # Convert numpy array to PIL Image
-    pil_img = Image.fromarray(image, mode="L")
+    src_height, src_width = image.shape[:2]
+
+    # A downscale by the same integer factor on both axes (e.g. 500x256 to 250x128)
+    # keeps the aspect ratio, so fit and crop have nothing to pad or cut and the
+    # result is a plain box average, which OpenCV's area resize does in a fast path
+    if target_width > 0 and target_height > 0 and mode != "stretch":
+        factor_x, rem_x = divmod(src_width, target_width)
+        factor_y, rem_y = divmod(src_height, target_height)
+        if rem_x == 0 and rem_y == 0 and factor_x == factor_y >= 2:
+            return cv2.resize(image, (target_width, target_height), interpolation=cv2.INTER_AREA)
 
     if mode == "stretch":
-        # Simple resize without maintaining aspect ratio
-        resized = pil_img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-        return np.array(resized)
+        # Simple resize without maintaining aspect ratio. This is a plain resample,
+        # so OpenCV does it directly on the array without a round trip through PIL.
+        # LANCZOS4 has a fixed-size kernel that aliases when shrinking, so
+        # downscales use area averaging instead (a box average for integer ratios).
+        if target_width < src_width or target_height < src_height:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LANCZOS4
+        return cv2.resize(image, (target_width, target_height), interpolation=interpolation)
+
+    # Convert numpy array to PIL Image
+    pil_img = Image.fromarray(image, mode="L")
 
-    elif mode == "fit":
+    if mode == "fit":
         # Resize to fit within bounds, maintain aspect ratio
+        # thumbnail() already applies a reducing gap (2.0) on its own
         pil_img.thumbnail((target_width, target_height), Image.Resampling.LANCZOS)
 
-        # Create new image with background
-        result = Image.new("L", (target_width, target_height), bg_color)
-
-        # Center the resized image
+        # Create the background array and center the resized image in it, copying
+        # the PIL pixels out exactly once
+        result = np.full((target_height, target_width), bg_color, dtype=np.uint8)
         x = (target_width - pil_img.width) // 2
         y = (target_height - pil_img.height) // 2
-        result.paste(pil_img, (x, y))
+        result[y : y + pil_img.height, x : x + pil_img.width] = np.asarray(pil_img)
 
-        return np.array(result)
+        return result
 
     elif mode == "crop":
         # Resize to cover entire area, crop excess
@@ -69,9 +95,6 @@ def resize_image(
             new_width = target_width
             new_height = int(target_width / img_ratio)
 
-        # Resize
-        resized = pil_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
         # Calculate crop position
         if crop_x is None:
             x = (new_width - target_width) // 2  # Center horizontally
@@ -83,52 +106,174 @@ def resize_image(
         else:
             y = max(0, min(crop_y, new_height - target_height))  # Clamp to valid range
 
-        # Crop to target size
-        cropped = resized.crop((x, y, x + target_width, y + target_height))
+        # Resize only the source region that ends up in the crop window, so the
+        # excess is never resampled and no full-size intermediate is built
+        scale_x = pil_img.width / new_width
+        scale_y = pil_img.height / new_height
+        box = (
+            x * scale_x,
+            y * scale_y,
+            (x + target_width) * scale_x,
+            (y + target_height) * scale_y,
+        )
+        cropped = pil_img.resize(
+            (target_width, target_height),
+            Image.Resampling.LANCZOS,
+            box=box,
+            reducing_gap=_REDUCING_GAP,
+        )
 
         return np.array(cropped)
 
 
-def flip_horizontal(image: np.ndarray) -> np.ndarray:
-    """Flip image horizontally (mirror left-right)."""
-    pil_img = Image.fromarray(image, mode="L")
-    flipped = pil_img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-    return np.array(flipped)
+def flip_horizontal(image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Flip image horizontally (mirror left-right).
 
+    Args:
+        image: Input image
+        out: Optional preallocated array of the same shape and dtype to write into
 
-def flip_vertical(image: np.ndarray) -> np.ndarray:
-    """Flip image vertically (mirror top-bottom)."""
-    pil_img = Image.fromarray(image, mode="L")
-    flipped = pil_img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-    return np.array(flipped)
+    Returns:
+        Flipped image as a C-contiguous array (out, if given)
+    """
+    # Materialize the flip instead of returning a negative-stride view, so later
+    # passes read forwards through memory
+    return cv2.flip(image, 1, dst=out)
+
+
+def flip_vertical(image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Flip image vertically (mirror top-bottom).
+
+    Args:
+        image: Input image
+        out: Optional preallocated array of the same shape and dtype to write into
+
+    Returns:
+        Flipped image as a C-contiguous array (out, if given)
+    """
+    return cv2.flip(image, 0, dst=out)
 
 
 def rotate_ccw_90(image: np.ndarray) -> np.ndarray:
     """Rotate image 90 degrees counter-clockwise."""
-    pil_img = Image.fromarray(image, mode="L")
-    rotated = pil_img.rotate(90, expand=True)
-    return np.array(rotated)
+    # cv2.rotate transposes in cache-sized blocks and returns a contiguous array,
+    # unlike np.rot90 whose strided view makes every later pass read column-wise
+    return cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
 
 
 def rotate_cw_90(image: np.ndarray) -> np.ndarray:
     """Rotate image 90 degrees clockwise."""
-    pil_img = Image.fromarray(image, mode="L")
-    rotated = pil_img.rotate(-90, expand=True)
-    return np.array(rotated)
+    return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
 
 
 def rotate_180(image: np.ndarray) -> np.ndarray:
     """Rotate image 180 degrees."""
-    pil_img = Image.fromarray(image, mode="L")
-    rotated = pil_img.rotate(180, expand=True)
-    return np.array(rotated)
+    return cv2.rotate(image, cv2.ROTATE_180)
 
 
 def invert_colors(image: np.ndarray) -> np.ndarray:
     """Invert image colors (black to white, white to black)."""
-    pil_img = Image.fromarray(image, mode="L")
-    inverted = ImageOps.invert(pil_img)
-    return np.array(inverted)
+    # For uint8, 255 - v == v ^ 0xFF; XOR needs no widening temporary
+    return np.bitwise_xor(image, np.uint8(255))
+
+
+def invert_colors_inplace(image: np.ndarray) -> np.ndarray:
+    """Invert image colors in place and return the same array."""
+    return np.bitwise_xor(image, np.uint8(255), out=image)
+
+
+def apply_transforms(image: np.ndarray, ops: Sequence[str], inplace: bool = False) -> np.ndarray:
+    """
+    Apply a sequence of 'flip-h', 'flip-v', 'rotate-90' (counter-clockwise) and
+    'invert' operations in at most two passes over the image.
+
+    The geometric operations are folded into a single orientation (an optional
+    transpose followed by optional flips) that is applied with one OpenCV call,
+    and any odd number of inversions is applied once afterwards.
+
+    Args:
+        image: Input image
+        ops: Operations in the order they should take effect
+        inplace: Allow inverting image itself when no geometric operation applies
+
+    Returns:
+        Transformed image; image itself if ops amount to nothing
+    """
+    transpose = flip_y = flip_x = invert = False
+    for op in ops:
+        if op == "flip-h":
+            flip_x = not flip_x
+        elif op == "flip-v":
+            flip_y = not flip_y
+        elif op == "rotate-90":
+            # rot90 ccw(X) = flipud(X.T); transposing swaps the flip axes
+            transpose = not transpose
+            flip_y, flip_x = not flip_x, flip_y
+        elif op == "invert":
+            invert = not invert
+
+    if transpose:
+        if flip_y and flip_x:
+            result = cv2.flip(cv2.transpose(image), -1)
+        elif flip_y:
+            result = cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        elif flip_x:
+            result = cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
+        else:
+            result = cv2.transpose(image)
+    elif flip_y or flip_x:
+        result = cv2.flip(image, -1 if flip_y and flip_x else 0 if flip_y else 1)
+    else:
+        result = image
+
+    if invert:
+        if result is image and not inplace:
+            return invert_colors(image)
+        invert_colors_inplace(result)
+    return result
+
+
+def pack_1bpp(image: np.ndarray, threshold: int = 128) -> np.ndarray:
+    """
+    Pack a grayscale image into 1 bit per pixel, 8 pixels per byte, MSB first.
+
+    Pixels brighter than the threshold become 1 (white). Each row starts on a byte
+    boundary; to pack pixels as one continuous bit stream, pass the image
+    reshaped to a single row.
+
+    Args:
+        image: Grayscale (or binary 0/255) image as numpy array
+        threshold: Threshold value (default: 128)
+
+    Returns:
+        uint8 array of shape (height, (width + 7) // 8)
+    """
+    return np.packbits(image > threshold, axis=1, bitorder="big")
+
+
+@functools.lru_cache(maxsize=64)
+def _blend_lut(base: int, alpha: float) -> np.ndarray:
+    """
+    Apply Pillow's Image.blend(base, image, alpha) arithmetic to every uint8 value.
+
+    Tables are cached since callers tend to repeat the same settings; they are
+    returned read-only for that reason.
+
+    Args:
+        base: Blend origin (0 for brightness, the image mean for contrast)
+        alpha: Blend factor; values outside 0..1 extrapolate
+
+    Returns:
+        256-entry uint8 lookup table
+    """
+    values = np.arange(256, dtype=np.float32)
+    blended = np.float32(base) + np.float32(alpha) * (values - np.float32(base))
+    # Pillow truncates towards zero and clips, it doesn't round
+    lut = np.clip(blended, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
 
 
 def adjust_brightness_contrast(
@@ -137,6 +282,11 @@ def adjust_brightness_contrast(
     """
     Adjust image brightness and contrast.
 
+    Both steps only depend on the input value (plus the image mean for contrast),
+    so they are folded into a single 256-entry lookup table and applied in one pass
+    over the image. The result matches Pillow's ImageEnhance.Brightness followed by
+    ImageEnhance.Contrast.
+
     Args:
         image: Input grayscale image
         brightness: Brightness multiplier (1.0 = no change, >1 = brighter, <1 = darker)
@@ -145,12 +295,14 @@ def adjust_brightness_contrast(
     Returns:
         Adjusted image
     """
-    pil_img: Image.Image = Image.fromarray(image, mode="L")
+    if brightness == 1.0 and contrast == 0:
+        return image.copy()
 
-    # Apply brightness
+    # Brightness blends towards black
     if brightness != 1.0:
-        brightness_enhancer = ImageEnhance.Brightness(pil_img)
-        pil_img = cast(Image.Image, brightness_enhancer.enhance(brightness))
+        lut = _blend_lut(0, brightness)
+    else:
+        lut = np.arange(256, dtype=np.uint8)
 
     # Apply contrast
     # Convert contrast from (-100 to 100) scale to Pillow's scale
@@ -159,10 +311,15 @@ def adjust_brightness_contrast(
         # Map -100..100 to roughly 0..2 scale for Pillow
         contrast_factor = 1.0 + (contrast / 100.0)
         contrast_factor = max(0.0, contrast_factor)  # Ensure non-negative
-        contrast_enhancer = ImageEnhance.Contrast(pil_img)
-        pil_img = cast(Image.Image, contrast_enhancer.enhance(contrast_factor))
 
-    return np.array(pil_img)
+        # Contrast blends towards the mean of the brightness-adjusted image, which
+        # the histogram gives without materializing that image
+        hist = cv2.calcHist([image], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+        total = int(np.dot(hist, lut))
+        mean = int(total / max(image.size, 1) + 0.5)
+        lut = _blend_lut(mean, contrast_factor)[lut]
+
+    return cv2.LUT(image, lut)
 
 
 def crop_image(image: np.ndarray, x: int, y: int, width: int, height: int) -> np.ndarray:
@@ -179,8 +336,7 @@ def crop_image(image: np.ndarray, x: int, y: int, width: int, height: int) -> np
     Returns:
         Cropped image region
     """
-    pil_img = Image.fromarray(image, mode="L")
-    img_w, img_h = pil_img.size
+    img_h, img_w = image.shape[:2]
 
     # Clip coordinates to image bounds
     x = max(0, min(x, img_w - 1))
@@ -188,5 +344,6 @@ def crop_image(image: np.ndarray, x: int, y: int, width: int, height: int) -> np
     x2 = min(x + width, img_w)
     y2 = min(y + height, img_h)
 
-    cropped = pil_img.crop((x, y, x2, y2))
-    return np.array(cropped)
+    # Return an owned, C-contiguous copy rather than a view into the source; for
+    # a full-width crop of a contiguous image this is a single memcpy
+    return image[y:y2, x:x2].copy()
@@ -4,14 +4,77 @@ Template Renderer for EinkComposer
 Renders templates with dynamic data using the EinkComposer for proven compatibility.
 """
 
+import functools
 import json
 import os
-import tempfile
 import qrcode
 import numpy as np
 import cv2  # type: ignore
+from typing import Tuple
 
 from . import EinkComposer
+from .image_ops import pack_1bpp
+
+
+@functools.lru_cache(maxsize=32)
+def _read_template(path: str, mtime_ns: int) -> str:
+    """Read a template file, cached per (path, modification time) so edits are picked up."""
+    with open(path, "r") as f:
+        return f.read()
+
+
+# Fixed QR mask pattern; skips qrcode's best_mask_pattern() search
+_QR_MASK_PATTERN = 0
+
+
+@functools.lru_cache(maxsize=32)
+def _render_qr(data: str, size: Tuple[int, int], error_correction: str) -> np.ndarray:
+    """
+    Generate a QR code as a grayscale image resized to ``size``.
+
+    Cached so that re-rendering a template with an unchanged URL (e.g. when only the
+    IP address changed) skips QR generation entirely. The mask pattern is fixed
+    instead of scoring all eight, which is most of qrcode's make() time and makes
+    no difference to readability at e-ink sizes.
+
+    Args:
+        data: Data to encode in QR code
+        size: (width, height) tuple for QR code size
+        error_correction: Error correction level (L, M, Q, H)
+
+    Returns:
+        Read-only uint8 array (0 for black, 255 for white), shared between callers
+    """
+    # Map error correction levels
+    correction_map = {
+        "L": qrcode.constants.ERROR_CORRECT_L,
+        "M": qrcode.constants.ERROR_CORRECT_M,
+        "Q": qrcode.constants.ERROR_CORRECT_Q,
+        "H": qrcode.constants.ERROR_CORRECT_H,
+    }
+
+    box_size = max(1, min(size) // 25)  # Adjust box size based on target size
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=correction_map.get(error_correction, qrcode.constants.ERROR_CORRECT_M),
+        box_size=box_size,
+        border=1,
+        mask_pattern=_QR_MASK_PATTERN,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    # Build the bitmap from the module matrix (border included) rather than through
+    # make_image(), which draws every module as a separate PIL rectangle
+    modules = np.array(qr.get_matrix(), dtype=bool)
+    img_array = np.where(modules, 0, 255).astype(np.uint8)
+    img_array = img_array.repeat(box_size, axis=0).repeat(box_size, axis=1)
+
+    # Resize using OpenCV
+    resized = cv2.resize(img_array, size, interpolation=cv2.INTER_NEAREST)
+
+    resized.flags.writeable = False
+    return resized
 
 
 class TemplateRenderer:
@@ -30,8 +93,9 @@ class TemplateRenderer:
     def _load_template(self) -> dict:
         """Load template from JSON file."""
         try:
-            with open(self.template_path, "r") as f:
-                return json.load(f)
+            mtime_ns = os.stat(self.template_path).st_mtime_ns
+            # Parse per renderer so each instance owns a mutable copy
+            return json.loads(_read_template(self.template_path, mtime_ns))
         except Exception as e:
             raise Exception(f"Failed to load template {self.template_path}: {e}")
 
@@ -50,39 +114,7 @@ class TemplateRenderer:
         Returns:
             Path to saved QR code file
         """
-        # Map error correction levels
-        correction_map = {
-            "L": qrcode.constants.ERROR_CORRECT_L,
-            "M": qrcode.constants.ERROR_CORRECT_M,
-            "Q": qrcode.constants.ERROR_CORRECT_Q,
-            "H": qrcode.constants.ERROR_CORRECT_H,
-        }
-
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=correction_map.get(error_correction, qrcode.constants.ERROR_CORRECT_M),
-            box_size=max(1, min(size) // 25),  # Adjust box size based on target size
-            border=1,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-
-        # Generate PIL image and convert to numpy array
-        pil_img = qr.make_image(fill_color="black", back_color="white")
-
-        # Convert PIL to numpy array
-        img_array = np.array(pil_img, dtype=np.uint8)
-
-        # Ensure proper grayscale values (0 for black, 255 for white)
-        # PIL QR code may return boolean or 0/1 values that need scaling
-        if img_array.max() <= 1:
-            img_array = img_array * 255
-
-        # Resize using OpenCV
-        resized = cv2.resize(img_array, size, interpolation=cv2.INTER_NEAREST)
-
-        # Save using OpenCV
-        cv2.imwrite(output_path, resized)
+        cv2.imwrite(output_path, _render_qr(data, tuple(size), error_correction))
 
         return output_path
 
@@ -136,33 +168,20 @@ class TemplateRenderer:
 
     def _add_qr_layer(self, composer: EinkComposer, layer_data: dict, tunnel_url: str):
         """Add QR code layer using EinkComposer."""
-        # Generate QR code to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-            temp_path = temp_file.name
-
         width = layer_data.get("width", 70)
         height = layer_data.get("height", 70)
         error_correction = layer_data.get("error_correction", "M")
 
-        # Generate QR code file
-        self._generate_qr_code_file(tunnel_url, temp_path, (width, height), error_correction)
-
-        # Add as image layer to composer
+        # Add as in-memory image layer to composer
         composer.add_image_layer(
             layer_id=layer_data["id"],
-            image_path=temp_path,
+            image_data=_render_qr(tunnel_url, (width, height), error_correction),
             x=layer_data.get("x", 0),
             y=layer_data.get("y", 0),
             width=width,
             height=height,
         )
 
-        # Store temp file for cleanup
-        if not hasattr(composer, "_temp_files"):
-            setattr(composer, "_temp_files", [])
-        temp_files: list = getattr(composer, "_temp_files")
-        temp_files.append(temp_path)
-
     def _add_regular_layer(self, composer: EinkComposer, layer_data: dict):
         """Add regular (non-placeholder) layer using EinkComposer."""
         layer_type = layer_data["type"]
@@ -256,38 +275,33 @@ class TemplateRenderer:
         Returns:
             True if successful
         """
-        temp_path = None
         composer = None
         display = None
 
         try:
-            from distiller_sdk.hardware.eink import Display, DisplayMode
+            from distiller_sdk.hardware.eink import Display, DisplayMode, DisplayError
 
             composer = self.render(ip_address, tunnel_url)
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            # Use EXACT same logic as working web UI
-            import numpy as np
-
             # Get the image and transform it for hardware orientation (same as web UI)
             img_array = composer.render()  # Get numpy array
 
-            # Hardware transform: flipud + rot90 converts 128×250 portrait to vendor format
-            img_array = np.flipud(img_array)
-            rotated_array = np.rot90(img_array, k=1)
-
-            # Save rotated image using OpenCV (same as web UI)
-            cv2.imwrite(temp_path, rotated_array)
+            # Hardware transform: flipud + rot90(k=1) converts 128×250 portrait to vendor
+            # format; as a single strided view that is a 180° turn and a transpose
+            hw_array = img_array[::-1, ::-1].T
 
             # Display on hardware - match web UI method exactly
             display = Display(auto_init=False)
             display.initialize()
 
-            # Convert PNG to raw data and display (same as web UI)
-            raw_data = display.convert_png_to_raw(temp_path)
+            # Pack to 1-bit the way the library's PNG conversion does (white above 128,
+            # MSB first, continuous across rows) without the PNG round trip
+            if hw_array.shape != (display.HEIGHT, display.WIDTH):
+                raise DisplayError(
+                    f"Invalid image size: {hw_array.shape[1]}x{hw_array.shape[0]}, "
+                    f"expected {display.WIDTH}x{display.HEIGHT}"
+                )
+            raw_data = pack_1bpp(hw_array.reshape(1, -1)).tobytes()
             display._display_raw(raw_data, DisplayMode.FULL)
 
             return True
@@ -298,11 +312,6 @@ class TemplateRenderer:
             raise Exception(f"Failed to display on hardware: {e}")
         finally:
             # Clean up resources
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    pass
             if composer:
                 self._cleanup_temp_files(composer)
             if display is not None:
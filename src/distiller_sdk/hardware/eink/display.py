@@ -12,6 +12,7 @@ Logging:
 import os
 import ctypes
 import logging
+import numpy as np
 from ctypes import c_bool, c_char_p, c_uint32, c_int, c_float, POINTER
 from enum import IntEnum
 from typing import Optional, Tuple, Union
@@ -556,18 +557,15 @@ class Display:
                         "src_width and src_height are required when transforming raw data"
                     )
 
-                # Apply transformations using Rust FFI functions
-                if flip_horizontal:
-                    raw_data = self._flip_horizontal_1bit(raw_data, src_width, src_height)
-
-                if flip_vertical:
-                    raw_data = self._flip_vertical_1bit(raw_data, src_width, src_height)
-
-                if rotation_degrees != 0:
-                    raw_data = self._rotate_1bit(raw_data, src_width, src_height, rotation_degrees)
-
-                if invert_colors:
-                    raw_data = self._invert_1bit(raw_data)
+                raw_data = self._transform_1bit(
+                    raw_data,
+                    src_width,
+                    src_height,
+                    rotation_degrees,
+                    flip_horizontal,
+                    flip_vertical,
+                    invert_colors,
+                )
 
             self._display_raw(raw_data, mode)
         else:
@@ -603,18 +601,15 @@ class Display:
             raw_data = self.convert_png_to_raw(filename)
             # Use actual display dimensions for transformations
 
-            # Apply transformations using Rust FFI functions
-            if flip_horizontal:
-                raw_data = self._flip_horizontal_1bit(raw_data, self.WIDTH, self.HEIGHT)
-
-            if flip_vertical:
-                raw_data = self._flip_vertical_1bit(raw_data, self.WIDTH, self.HEIGHT)
-
-            if rotation_degrees != 0:
-                raw_data = self._rotate_1bit(raw_data, self.WIDTH, self.HEIGHT, rotation_degrees)
-
-            if invert_colors:
-                raw_data = self._invert_1bit(raw_data)
+            raw_data = self._transform_1bit(
+                raw_data,
+                self.WIDTH,
+                self.HEIGHT,
+                rotation_degrees,
+                flip_horizontal,
+                flip_vertical,
+                invert_colors,
+            )
 
             self._display_raw(raw_data, mode)
         else:
@@ -634,7 +629,7 @@ class Display:
             raise DisplayError(f"Data must be exactly {self.ARRAY_SIZE} bytes, got {len(data)}")
 
         # Convert bytes to ctypes array
-        data_array = (ctypes.c_ubyte * len(data))(*data)
+        data_array = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
 
         result = self._lib.display_image_raw(data_array, int(mode))
         self._check_result(result, "Display raw image")
@@ -856,7 +851,7 @@ class Display:
             raise DisplayError(f"Buffer must be exactly {self.ARRAY_SIZE} bytes, got {len(buffer)}")
 
         # Create mutable copy of buffer
-        buffer_array = (ctypes.c_ubyte * len(buffer))(*buffer)
+        buffer_array = (ctypes.c_ubyte * len(buffer)).from_buffer_copy(buffer)
         text_bytes = text.encode("utf-8")
 
         success = self._lib.text_overlay(
@@ -905,7 +900,7 @@ class Display:
             raise DisplayError(f"Buffer must be exactly {self.ARRAY_SIZE} bytes, got {len(buffer)}")
 
         # Create mutable copy of buffer
-        buffer_array = (ctypes.c_ubyte * len(buffer))(*buffer)
+        buffer_array = (ctypes.c_ubyte * len(buffer)).from_buffer_copy(buffer)
 
         success = self._lib.shape_draw_rect_filled(
             buffer_array,
@@ -1098,7 +1093,7 @@ class Display:
 
     def _rotate_1bit(self, data: bytes, width: int, height: int, degrees: int) -> bytes:
         """
-        Rotate 1-bit image data using Rust FFI.
+        Rotate 1-bit image data.
 
         Args:
             data: Input 1-bit packed image data
@@ -1109,48 +1104,15 @@ class Display:
         Returns:
             Rotated 1-bit packed data
         """
-        # Map degrees to Rust rotation enum
-        rotation_map = {
-            0: -1,  # No rotation
-            90: 0,  # 90 degrees
-            180: 1,  # 180 degrees
-            270: 2,  # 270 degrees
-        }
-
-        normalized_degrees = degrees % 360
-        if normalized_degrees not in rotation_map:
-            # Find closest valid rotation
-            closest = min(rotation_map.keys(), key=lambda x: abs(x - normalized_degrees))
-            normalized_degrees = closest
-
-        rotation = rotation_map[normalized_degrees]
-        if rotation == -1:
+        normalized_degrees = _normalize_rotation(degrees)
+        if normalized_degrees == 0:
             return data  # No rotation needed
 
-        # Calculate output size
-        if normalized_degrees in (90, 270):
-            out_width, out_height = height, width
-        else:
-            out_width, out_height = width, height
-
-        out_size = (out_width * out_height + 7) // 8
-
-        # Prepare buffers
-        input_array = (ctypes.c_ubyte * len(data))(*data)
-        output_array = (ctypes.c_ubyte * out_size)()
-
-        success = self._lib.image_rotate_1bit(
-            input_array, c_uint32(width), c_uint32(height), c_int(rotation), output_array
-        )
-
-        if not success:
-            raise DisplayError(f"Failed to rotate image by {degrees} degrees")
-
-        return bytes(output_array)
+        return rotate_bitpacked(data, normalized_degrees, width, height)
 
     def _flip_horizontal_1bit(self, data: bytes, width: int, height: int) -> bytes:
         """
-        Flip 1-bit image horizontally using Rust FFI.
+        Flip 1-bit image horizontally.
 
         Args:
             data: Input 1-bit packed image data
@@ -1160,28 +1122,11 @@ class Display:
         Returns:
             Flipped 1-bit packed data
         """
-        expected_bytes = (width * height + 7) // 8
-        if len(data) < expected_bytes:
-            raise ValueError(
-                f"Input data too small. Expected {expected_bytes} bytes, got {len(data)}"
-            )
-
-        # Prepare buffers
-        input_array = (ctypes.c_ubyte * len(data))(*data)
-        output_array = (ctypes.c_ubyte * expected_bytes)()
-
-        success = self._lib.image_flip_horizontal_1bit(
-            input_array, c_uint32(width), c_uint32(height), output_array
-        )
-
-        if not success:
-            raise DisplayError("Failed to flip image horizontally")
-
-        return bytes(output_array)
+        return _pack_1bit(_unpack_1bit(data, width, height)[:, ::-1])
 
     def _flip_vertical_1bit(self, data: bytes, width: int, height: int) -> bytes:
         """
-        Flip 1-bit image vertically using Rust FFI.
+        Flip 1-bit image vertically.
 
         Args:
             data: Input 1-bit packed image data
@@ -1191,57 +1136,65 @@ class Display:
         Returns:
             Flipped 1-bit packed data
         """
-        expected_bytes = (width * height + 7) // 8
-        if len(data) < expected_bytes:
-            raise ValueError(
-                f"Input data too small. Expected {expected_bytes} bytes, got {len(data)}"
-            )
-
-        # Prepare buffers
-        input_array = (ctypes.c_ubyte * len(data))(*data)
-        output_array = (ctypes.c_ubyte * expected_bytes)()
-
-        success = self._lib.image_flip_vertical_1bit(
-            input_array, c_uint32(width), c_uint32(height), output_array
-        )
-
-        if not success:
-            raise DisplayError("Failed to flip image vertically")
-
-        return bytes(output_array)
+        return _pack_1bit(_unpack_1bit(data, width, height)[::-1])
 
     def _invert_1bit(self, data: bytes) -> bytes:
         """
         Invert colors in 1-bit image data.
 
-        Uses a hybrid approach: Python for small data (avoiding FFI overhead),
-        Rust FFI for larger data where performance gains outweigh overhead.
-
         Args:
             data: Input 1-bit packed image data
 
         Returns:
             Inverted 1-bit packed data
         """
-        size = len(data)
-
-        # For small data (<4KB), use Python to avoid FFI overhead
-        # This threshold is based on benchmark results showing FFI overhead
-        # dominates for small operations
-        if size < 4096:
-            # Simple bitwise NOT operation in Python
-            return bytes(~b & 0xFF for b in data)
+        return np.bitwise_not(np.frombuffer(data, dtype=np.uint8)).tobytes()
 
-        # For larger data, use Rust FFI for better performance
-        input_array = (ctypes.c_ubyte * size)(*data)
-        output_array = (ctypes.c_ubyte * size)()
+    def _transform_1bit(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        degrees: int = 0,
+        flip_horizontal: bool = False,
+        flip_vertical: bool = False,
+        invert_colors: bool = False,
+    ) -> bytes:
+        """
+        Apply flips, rotation and inversion to 1-bit image data in one pass.
 
-        success = self._lib.image_invert_1bit(input_array, c_uint32(size), output_array)
+        Gives the same result as calling _flip_horizontal_1bit, _flip_vertical_1bit,
+        _rotate_1bit and _invert_1bit in that order, but the flips and rotation are
+        strided views, so the buffer is unpacked and repacked only once.
 
-        if not success:
-            raise DisplayError("Failed to invert image colors")
+        Args:
+            data: Input 1-bit packed image data
+            width: Image width in pixels
+            height: Image height in pixels
+            degrees: Rotation angle (0, 90, 180, 270)
+            flip_horizontal: Mirror left-right before rotating
+            flip_vertical: Mirror top-bottom before rotating
+            invert_colors: Invert colors after the geometric transforms
 
-        return bytes(output_array)
+        Returns:
+            Transformed 1-bit packed data
+        """
+        normalized_degrees = _normalize_rotation(degrees)
+        if not (flip_horizontal or flip_vertical or normalized_degrees):
+            return self._invert_1bit(data) if invert_colors else data
+
+        bits = _unpack_1bit(data, width, height)
+        if flip_horizontal:
+            bits = bits[:, ::-1]
+        if flip_vertical:
+            bits = bits[::-1]
+        if normalized_degrees:
+            bits = np.rot90(bits, k=_ROTATION_K[normalized_degrees])
+
+        packed = np.packbits(bits, axis=None)
+        if invert_colors:
+            np.bitwise_not(packed, out=packed)
+        return packed.tobytes()
 
     def display_png_auto(
         self,
@@ -1461,10 +1414,54 @@ def initialize_display_config() -> None:
     display.initialize_config()
 
 
+# np.rot90 turns counter-clockwise for positive k; the display's 90 is clockwise
+_ROTATION_K = {90: -1, 180: 2, 270: 1}
+
+
+def _normalize_rotation(degrees: int) -> int:
+    """Map an angle in degrees to the closest of 0, 90, 180 and 270."""
+    normalized_degrees = degrees % 360
+    if normalized_degrees not in (0, 90, 180, 270):
+        # Find closest valid rotation
+        normalized_degrees = min((0, 90, 180, 270), key=lambda x: abs(x - normalized_degrees))
+    return normalized_degrees
+
+
+def _unpack_1bit(data: bytes, width: int, height: int) -> np.ndarray:
+    """
+    Unpack MSB-first 1-bit data into a (height, width) array of 0/1 values.
+
+    Args:
+        data: 1-bit packed image data as bytes
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        uint8 array of shape (height, width)
+
+    Raises:
+        ValueError: If data is smaller than width * height bits
+    """
+    expected_bytes = (width * height + 7) // 8
+    if len(data) < expected_bytes:
+        raise ValueError(f"Input data too small. Expected {expected_bytes} bytes, got {len(data)}")
+
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8, count=expected_bytes))
+    return bits[: width * height].reshape(height, width)
+
+
+def _pack_1bit(bits: np.ndarray) -> bytes:
+    """Pack a 2D array of 0/1 values (any strides) into MSB-first 1-bit bytes."""
+    return np.packbits(bits, axis=None).tobytes()
+
+
 def rotate_bitpacked(data: bytes, angle: int, width: int, height: int) -> bytes:
     """
     Rotate 1-bit packed image data by the specified angle.
 
+    Matches the Rust image_rotate_1bit() mapping, where 90 moves the top-left pixel
+    to the top-right corner.
+
     Args:
         data: 1-bit packed image data as bytes
         angle: Rotation angle (0, 90, 180, 270 degrees)
@@ -1480,42 +1477,15 @@ def rotate_bitpacked(data: bytes, angle: int, width: int, height: int) -> bytes:
     if angle not in [0, 90, 180, 270]:
         raise DisplayError(f"Invalid rotation angle: {angle}. Must be 0, 90, 180, or 270")
 
-    display = Display(auto_init=False)
-
-    # Convert angle to rotation value expected by C function
-    # Note: The C function has a non-intuitive mapping:
-    # 0 = rotate 90 degrees
-    # 1 = rotate 180 degrees
-    # 2 = rotate 270 degrees
-    # For angle 0 (no rotation), we just return the original data
     if angle == 0:
         return data
 
-    rotation_map = {90: 0, 180: 1, 270: 2}
-    rotation = rotation_map[angle]
-
-    # Calculate output dimensions
-    if angle in [90, 270]:
-        out_width, out_height = height, width
-    else:
-        out_width, out_height = width, height
-
-    # Calculate output size
-    output_size = (out_width * out_height + 7) // 8
-
-    # Create output buffer
-    output = (ctypes.c_ubyte * output_size)()
-
-    # Create input array from bytes
-    input_array = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
-
-    # Call C function
-    success = display._lib.image_rotate_1bit(input_array, width, height, rotation, output)
-
-    if not success:
-        raise DisplayError(f"Failed to rotate image by {angle} degrees")
+    try:
+        bits = _unpack_1bit(data, width, height)
+    except ValueError as e:
+        raise DisplayError(f"Failed to rotate image by {angle} degrees: {e}")
 
-    return bytes(output)
+    return _pack_1bit(np.rot90(bits, k=_ROTATION_K[angle]))
 
 
 def rotate_bitpacked_ccw_90(data: bytes, width: int, height: int) -> bytes:
@@ -1578,24 +1548,12 @@ def flip_bitpacked_horizontal(data: bytes, width: int, height: int) -> bytes:
     Raises:
         DisplayError: If flip operation fails
     """
-    display = Display(auto_init=False)
-
-    # Calculate buffer size
-    buffer_size = (width * height + 7) // 8
-
-    # Create output buffer
-    output = (ctypes.c_ubyte * buffer_size)()
-
-    # Create input array from bytes
-    input_array = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
-
-    # Call C function
-    success = display._lib.image_flip_horizontal_1bit(input_array, width, height, output)
-
-    if not success:
-        raise DisplayError("Failed to flip image horizontally")
+    try:
+        bits = _unpack_1bit(data, width, height)
+    except ValueError as e:
+        raise DisplayError(f"Failed to flip image horizontally: {e}")
 
-    return bytes(output)
+    return _pack_1bit(bits[:, ::-1])
 
 
 def flip_bitpacked_vertical(data: bytes, width: int, height: int) -> bytes:
@@ -1613,24 +1571,12 @@ def flip_bitpacked_vertical(data: bytes, width: int, height: int) -> bytes:
     Raises:
         DisplayError: If flip operation fails
     """
-    display = Display(auto_init=False)
-
-    # Calculate buffer size
-    buffer_size = (width * height + 7) // 8
-
-    # Create output buffer
-    output = (ctypes.c_ubyte * buffer_size)()
-
-    # Create input array from bytes
-    input_array = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
-
-    # Call C function
-    success = display._lib.image_flip_vertical_1bit(input_array, width, height, output)
-
-    if not success:
-        raise DisplayError("Failed to flip image vertically")
+    try:
+        bits = _unpack_1bit(data, width, height)
+    except ValueError as e:
+        raise DisplayError(f"Failed to flip image vertically: {e}")
 
-    return bytes(output)
+    return _pack_1bit(bits[::-1])
 
 
 def invert_bitpacked_colors(data: bytes) -> bytes:
@@ -1646,18 +1592,7 @@ def invert_bitpacked_colors(data: bytes) -> bytes:
     Raises:
         DisplayError: If invert operation fails
     """
-    display = Display(auto_init=False)
-
-    # Create output buffer same size as input
-    output = (ctypes.c_ubyte * len(data))()
-
-    # Create input array from bytes
-    input_array = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
-
-    # Call C function
-    success = display._lib.image_invert_1bit(input_array, len(data), output)
-
-    if not success:
-        raise DisplayError("Failed to invert image colors")
+    if not data:
+        raise DisplayError("Failed to invert image colors: no data")
 
-    return bytes(output)
+    return np.bitwise_not(np.frombuffer(data, dtype=np.uint8)).tobytes()
@@ -4,6 +4,7 @@ import logging
 import re
 import tempfile
 
+from distiller_sdk.hardware import _subproc_cache
 from distiller_sdk.hardware.audio.audio import Audio
 from distiller_sdk import get_model_path
 
@@ -80,8 +81,10 @@ class Piper:
 
     def find_hw_by_name(self, card_name):
         try:
-            result = subprocess.run(["aplay", "-l"], capture_output=True, text=True, check=True)
-            lines = result.stdout.splitlines()
+            returncode, stdout, stderr = _subproc_cache.cached_run(["aplay", "-l"])
+            if returncode != 0:
+                raise RuntimeError(stderr.strip() or f"aplay -l exited with status {returncode}")
+            lines = stdout.splitlines()
 
             for line in lines:
                 if "card" in line and card_name in line: